@@ -45,7 +45,11 @@ def cli() -> None:
     "--workers",
     type=int,
     default=-1,
-    help="The number of worker processes to use. Set to -1 (default) to use all available CPU cores.",
+    help=(
+        "The number of worker processes to use. Set to -1 (default) to use all available CPU cores. When processing "
+        "multiple jobs without a job ID, the jobs run in parallel and split the workers evenly. Set to 1 to run the "
+        "jobs sequentially."
+    ),
 )
 def process(
     session_path: Path,
@@ -6,14 +6,20 @@ monitor processing status.
 
 from __future__ import annotations
 
-from os import cpu_count
-from typing import Any, Literal
+import os
+import json
+from typing import TYPE_CHECKING, Any, Literal
+import asyncio
 from pathlib import Path
-from threading import Lock, Thread
+from functools import partial
+from threading import Lock
 import traceback
+from collections import Counter, deque
 from dataclasses import field, dataclass
+from multiprocessing import get_context, get_all_start_methods
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-from ataraxis_time import PrecisionTimer, TimerPrecisions
 from sl_shared_assets import SessionData, SessionTypes, ProcessingStatus, ProcessingTracker, ProcessingTrackers
 from mcp.server.fastmcp import FastMCP
 
@@ -21,10 +27,15 @@ from .pipeline import (
     BehaviorJobNames,
     _execute_job,
     get_session_root,
+    _generate_job_names,
+    _get_available_cores,
     _resolve_available_jobs,
     _initialize_processing_tracker,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
 # Initializes the MCP server with JSON response mode for structured output.
 mcp = FastMCP(name="sl-behavior", json_response=True)
 
@@ -34,6 +45,45 @@ _RESERVED_CORES: int = 4
 # Maximum CPU cores any single job can use.
 _MAXIMUM_JOB_CORES: int = 30
 
+# Maximum number of threads used to run I/O-bound filesystem queries, such as reading session tracker files.
+_MAXIMUM_IO_THREADS: int = 8
+
+# All base job names supported by the behavior processing pipeline, resolved once at import time.
+_BEHAVIOR_JOB_NAMES: tuple[BehaviorJobNames, ...] = tuple(BehaviorJobNames)
+
+# Maps the processing status of each tracked job to the label used to report the job's status. Jobs with any other
+# status are reported as pending.
+_JOB_STATUS_LABELS: dict[ProcessingStatus, str] = {
+    ProcessingStatus.SUCCEEDED: "done",
+    ProcessingStatus.FAILED: "failed",
+    ProcessingStatus.RUNNING: "running",
+}
+
+# Session statuses resolved from the tracked job states, in the order of decreasing priority. If the conditions for
+# multiple statuses are met, the session is assigned the status with the highest priority.
+_STATUS_PRIORITY: tuple[str, ...] = ("PROCESSING", "FAILED", "PARTIAL", "SUCCEEDED", "PENDING")
+
+# Maps every combination of met status conditions, encoded as a bit field that follows the _STATUS_PRIORITY order,
+# to the resulting session status. Precomputing the table replaces the status condition cascade with a single lookup.
+_STATUS_TABLE: tuple[str, ...] = tuple(
+    next((status for bit, status in enumerate(_STATUS_PRIORITY) if key >> bit & 1), "UNKNOWN")
+    for key in range(1 << len(_STATUS_PRIORITY))
+)
+
+# Maximum number of sessions whose job name mappings and parsed trackers are kept in the module-level caches.
+_MAXIMUM_CACHED_SESSIONS: int = 1024
+
+# The file used to persist the results of the most recent batch across server restarts.
+_BATCH_STATE_FILE: Path = Path.home().joinpath(".sl-behavior", "batch_state.json")
+
+# The multiprocessing start method used to launch session worker processes. Unlike fork, both methods are safe to use
+# from the multithreaded server process. The forkserver method is preferred where available, as it starts new workers
+# faster than spawn.
+_SESSION_START_METHOD: str = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+
+# The sysfs directory that describes the NUMA nodes of the host system on Linux.
+_NUMA_NODE_DIRECTORY: Path = Path("/sys/devices/system/node")
+
 # Session types that contain processable behavior data.
 _PROCESSABLE_SESSION_TYPES: frozenset[SessionTypes] = frozenset(
     {
@@ -48,29 +98,65 @@ _PROCESSABLE_SESSION_TYPES: frozenset[SessionTypes] = frozenset(
 class _BatchState:
     """Tracks state for batch processing operations."""
 
-    queued: list[Path] = field(default_factory=list)
-    active: dict[str, Thread] = field(default_factory=dict)
-    completed: set[str] = field(default_factory=set)
-    failed: set[str] = field(default_factory=set)
+    queued: deque[str] = field(default_factory=deque)
+    queued_set: set[str] = field(default_factory=set)
+    """Mirrors the session keys stored in the queue to support constant-time membership checks."""
+    active: dict[str, Future[tuple[bool, list[str]]]] = field(default_factory=dict)
+    """Maps the keys of sessions that are currently being processed to the futures that process them."""
+    completed: dict[str, None] = field(default_factory=dict)
+    """Stores the keys of successfully processed sessions in the order they finished processing."""
+    failed: dict[str, None] = field(default_factory=dict)
+    """Stores the keys of sessions that failed processing in the order they finished processing."""
     errors: dict[str, list[str]] = field(default_factory=dict)
     """Maps session keys to lists of error messages for failed jobs."""
+    terminal_status_cache: dict[str, dict[str, Any]] = field(default_factory=dict)
+    """Maps the keys of completed and failed sessions to their final status dictionaries."""
     job_flags: dict[str, bool] = field(default_factory=dict)
     workers: int = -1
     max_parallel: int = 1
     lock: Lock = field(default_factory=Lock)
-    manager_thread: Thread | None = None
+    """Guards all batch state fields."""
+    executor: ProcessPoolExecutor | None = None
+    """Runs the processing pipelines of up to max_parallel sessions at the same time, each in a separate process."""
+    free_cpu_sets: list[frozenset[int]] = field(default_factory=list)
+    """Stores the disjoint CPU core sets that are not currently assigned to an active session."""
+    session_cpu_sets: dict[str, frozenset[int]] = field(default_factory=dict)
+    """Maps the keys of active sessions to the CPU core sets they are pinned to."""
+    session_cache: dict[str, SessionData] = field(default_factory=dict)
+    """Maps session keys to the SessionData instances loaded by the server's status queries during the batch."""
 
 
 # Module-level batch processing state.
 _batch_state: _BatchState | None = None
 
+# Ensures that only one batch can be started at a time.
+_batch_start_lock: Lock = Lock()
+
+# Runs I/O-bound filesystem queries issued by the MCP tools in parallel.
+_io_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=min(_MAXIMUM_IO_THREADS, os.cpu_count() or _MAXIMUM_IO_THREADS), thread_name_prefix="sl-behavior-io"
+)
+
+# Caches the mappings of processing job IDs to base job names, keyed by the session root path and session name.
+_job_name_cache: dict[tuple[str, str], dict[str, str]] = {}
+
+# Guards access to the job name cache shared by all status queries.
+_job_name_cache_lock: Lock = Lock()
+
+# Caches parsed processing trackers, keyed by the tracker file path. Each tracker is stored together with the
+# modification time (in nanoseconds) and the size of its file at the time it was parsed.
+_tracker_cache: dict[str, tuple[int, int, ProcessingTracker]] = {}
+
+# Guards access to the tracker cache shared by all status queries.
+_tracker_cache_lock: Lock = Lock()
+
 
 def _calculate_job_workers(requested_workers: int) -> int:
     """Calculates the number of CPU cores to allocate for a processing job.
 
-    Determines available cores based on system CPU count minus reserved cores, capped at the maximum limit.
-    This ensures each job receives substantial resources while leaving headroom for system operations
-    and allowing multiple sessions to process in parallel.
+    Determines available cores based on the number of cores available to the process minus reserved cores, capped at
+    the maximum limit. This ensures each job receives substantial resources while leaving headroom for system
+    operations and allowing multiple sessions to process in parallel.
 
     Args:
         requested_workers: The user-requested worker count. Set to -1 or less to use the calculated default.
@@ -81,9 +167,9 @@ def _calculate_job_workers(requested_workers: int) -> int:
     if requested_workers > 0:
         return min(requested_workers, _MAXIMUM_JOB_CORES)
 
-    available_cores = cpu_count()
+    available_cores = _get_available_cores()
     if available_cores is None:
-        return _RESERVED_CORES  # Fallback if cpu_count() returns None.
+        return _RESERVED_CORES  # Fallback if the number of available cores cannot be determined.
 
     return min(max(1, available_cores - _RESERVED_CORES), _MAXIMUM_JOB_CORES)
 
@@ -91,22 +177,113 @@ def _calculate_job_workers(requested_workers: int) -> int:
 def _calculate_max_parallel_sessions() -> int:
     """Calculates the maximum number of sessions that can run in parallel.
 
-    Uses the formula: floor((cpu_count + 15) / 30) to determine optimal parallelization.
+    Uses the formula: floor((available_cores + 15) / 30) to determine optimal parallelization.
 
     Returns:
         The maximum number of parallel sessions.
     """
-    available_cores = cpu_count()
+    available_cores = _get_available_cores()
     if available_cores is None:
         return 1
 
     return max(1, (available_cores + 15) // _MAXIMUM_JOB_CORES)
 
 
+def _parse_cpu_list(cpu_list: str) -> list[int]:
+    """Parses a Linux CPU list string, such as '0-3,8-11', into the list of CPU core indices it describes.
+
+    Args:
+        cpu_list: The CPU list string to parse.
+
+    Returns:
+        The list of CPU core indices described by the input string.
+    """
+    cores: list[int] = []
+    for core_range in cpu_list.strip().split(","):
+        if not core_range:
+            continue
+        start, _, end = core_range.partition("-")
+        cores.extend(range(int(start), int(end or start) + 1))
+    return cores
+
+
+def _compute_session_cpu_sets(max_parallel: int) -> list[frozenset[int]]:
+    """Splits the CPU cores available to the server into disjoint sets, one for each parallel session.
+
+    Orders the available cores by NUMA node before splitting them, so that each set spans as few nodes as possible.
+    This keeps the worker processes of each session close to the memory that stores the data they process and
+    prevents the operating system from migrating the workers of concurrent sessions across the same cores.
+
+    Notes:
+        CPU affinity is only supported on Linux. On other platforms, this function returns an empty list and sessions
+        are not pinned to specific cores.
+
+    Args:
+        max_parallel: The maximum number of sessions processed in parallel.
+
+    Returns:
+        A list of max_parallel disjoint CPU core sets, or an empty list if CPU affinity is not supported or there are
+        fewer available cores than parallel sessions.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return []
+
+    available_cores = os.sched_getaffinity(0)
+    if len(available_cores) < max_parallel:
+        return []
+
+    # Orders the available cores by NUMA node. Since nodes do not share cores, this produces no duplicates. Any cores
+    # not described by the node topology (or all cores, if the topology is not exposed) are appended in index order.
+    ordered_cores: list[int] = []
+    for node_directory in sorted(_NUMA_NODE_DIRECTORY.glob("node[0-9]*"), key=lambda path: int(path.name[4:])):
+        try:
+            node_cores = _parse_cpu_list(cpu_list=node_directory.joinpath("cpulist").read_text())
+        except (OSError, ValueError):
+            continue
+        ordered_cores.extend(core for core in node_cores if core in available_cores)
+    ordered_cores.extend(sorted(available_cores.difference(ordered_cores)))
+
+    # Splits the ordered cores into contiguous sets. Any leftover cores are added to the last set.
+    set_size = len(ordered_cores) // max_parallel
+    cpu_sets = [frozenset(ordered_cores[index * set_size : (index + 1) * set_size]) for index in range(max_parallel)]
+    cpu_sets[-1] = cpu_sets[-1].union(ordered_cores[max_parallel * set_size :])
+    return cpu_sets
+
+
+def _load_session(session_path: Path) -> SessionData:
+    """Loads the data of the target session.
+
+    Reuses the SessionData instance loaded earlier during the current batch, if available. Session data does not
+    change during processing, so status queries only need to load each session once per batch.
+
+    Notes:
+        The cache is stored in the server process. Sessions are processed in separate worker processes, which load
+        their session data directly and do not use this function.
+
+    Args:
+        session_path: The path to the session's data directory.
+
+    Returns:
+        The SessionData instance for the target session.
+    """
+    session_key = str(session_path)
+    batch_state = _batch_state
+    if batch_state is not None:
+        with batch_state.lock:
+            session = batch_state.session_cache.get(session_key)
+        if session is not None:
+            return session
+
+    session = SessionData.load(session_path=session_path)
+    if batch_state is not None:
+        with batch_state.lock:
+            batch_state.session_cache[session_key] = session
+    return session
+
+
 def _execute_single_job(
     session_path: Path,
     base_job_name: str,
-    session_name: str,
     job_id: str,
     workers: int,
     tracker: ProcessingTracker,
@@ -116,7 +293,6 @@ def _execute_single_job(
     Args:
         session_path: The path to the session's data directory.
         base_job_name: The base job name (from BehaviorJobNames).
-        session_name: The unique identifier of the session being processed.
         job_id: The unique hexadecimal identifier for this processing job.
         workers: The number of worker processes to use for parallel processing.
         tracker: The ProcessingTracker instance used to track the pipeline's runtime status.
@@ -124,12 +300,10 @@ def _execute_single_job(
     Returns:
         A tuple containing the job name, success status, and error message if failed.
     """
-    full_job_name = f"{session_name}_{base_job_name}"
-
     try:
         _execute_job(
             session_path=session_path,
-            job_name=full_job_name,
+            job_name=base_job_name,
             job_id=job_id,
             workers=workers,
             tracker=tracker,
@@ -147,6 +321,7 @@ def _run_session_processing(
     session_path: Path,
     job_flags: dict[str, bool],
     workers: int,
+    cpu_set: frozenset[int] | None = None,
 ) -> tuple[bool, list[str]]:
     """Executes the processing pipeline for a single session.
 
@@ -156,6 +331,8 @@ def _run_session_processing(
         session_path: The path to the session's data directory.
         job_flags: Dictionary mapping job names to whether they should run.
         workers: The number of CPU cores to use for each job.
+        cpu_set: The set of CPU cores to pin the session's processing to. If not provided, the session can use any
+            core available to the server.
 
     Returns:
         A tuple containing a boolean indicating overall success and a list of error messages for any failed jobs.
@@ -163,15 +340,20 @@ def _run_session_processing(
     job_errors: list[str] = []
 
     try:
-        # Loads the session data and initializes the processing tracker.
+        # Pins the session's worker process to the assigned CPU cores. All worker processes spawned by the session's
+        # jobs inherit this affinity.
+        if cpu_set and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpu_set)
+
+        # Loads the session data and initializes the processing tracker. Since this function runs in a separate
+        # process, it cannot reuse the session data cached by the server process.
         session = SessionData.load(session_path=session_path)
-        session_name = session.session_name
         tracker = ProcessingTracker(
             file_path=session.tracking_data.tracking_data_path.joinpath(ProcessingTrackers.BEHAVIOR)
         )
 
         # Resolves which jobs are available based on existing log files.
-        available_jobs = _resolve_available_jobs(session_path=session_path)
+        available_jobs = _resolve_available_jobs(session_path=session_path, session=session)
 
         # Determines which base jobs to run (requested AND available).
         base_jobs_to_run = [
@@ -184,7 +366,14 @@ def _run_session_processing(
             return True, []  # No jobs to run is considered success.
 
         # Initializes the tracker file and gets job IDs.
-        job_ids = _initialize_processing_tracker(session_path=session_path, base_job_names=base_jobs_to_run)
+        job_names = _generate_job_names(session_name=session.session_name, base_job_names=base_jobs_to_run)
+        job_ids = _initialize_processing_tracker(
+            session_path=session_path,
+            base_job_names=base_jobs_to_run,
+            session=session,
+            tracker=tracker,
+            job_names=job_names,
+        )
 
         # Executes jobs sequentially, each with full worker allocation.
         all_succeeded = True
@@ -192,8 +381,7 @@ def _run_session_processing(
             job_name, succeeded, error_msg = _execute_single_job(
                 session_path=session_path,
                 base_job_name=base_job_name,
-                session_name=session_name,
-                job_id=job_ids[f"{session_name}_{base_job_name}"],
+                job_id=job_ids[job_names[base_job_name]],
                 workers=workers,
                 tracker=tracker,
             )
@@ -210,76 +398,285 @@ def _run_session_processing(
         return all_succeeded, job_errors
 
 
-def _session_worker(session_path: Path, job_flags: dict[str, bool], workers: int) -> None:
-    """Worker function that processes a session and updates batch state on completion.
+def _save_batch_state(batch_state: _BatchState) -> None:
+    """Persists the completed and failed sessions of the batch to the batch state file.
+
+    Notes:
+        This function must be called while holding the batch state lock. Failing to write the file does not interrupt
+        batch processing, as the persisted state is only used to restore batch results after a server restart.
 
     Args:
-        session_path: The path to the session's data directory.
-        job_flags: Dictionary mapping job names to whether they should run.
-        workers: The number of CPU cores to use for each job.
+        batch_state: The state of the batch to persist.
     """
-    session_key = str(session_path)
-    success, errors = _run_session_processing(session_path=session_path, job_flags=job_flags, workers=workers)
+    state = {
+        "completed": list(batch_state.completed),
+        "failed": list(batch_state.failed),
+        "errors": batch_state.errors,
+    }
+    try:
+        _BATCH_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+        # Writes the state to a temporary file first and then replaces the state file with it, so that the state file
+        # is never left partially written.
+        temporary_file = _BATCH_STATE_FILE.with_suffix(".tmp")
+        temporary_file.write_text(json.dumps(state))
+        temporary_file.replace(_BATCH_STATE_FILE)
+    except OSError:
+        return
 
-    if _batch_state is not None:
-        with _batch_state.lock:
-            # Removes from active, adds to completed or failed.
-            _batch_state.active.pop(session_key, None)
-            if success:
-                _batch_state.completed.add(session_key)
-            else:
-                _batch_state.failed.add(session_key)
-                if errors:
-                    _batch_state.errors[session_key] = errors
 
+def _restore_batch_state() -> None:
+    """Restores the completed and failed sessions of the most recent batch from the batch state file.
 
-def _batch_manager() -> None:
-    """Manager thread that monitors active sessions and starts queued sessions.
+    Allows get_processing_status_tool to report the results of a batch processed before the server was restarted. The
+    status of each restored session is re-resolved from its processing tracker file when it is queried, so the
+    restored results cannot go stale.
+    """
+    global _batch_state
 
-    Runs continuously until all sessions are processed (queue empty and no active sessions).
+    try:
+        state = json.loads(_BATCH_STATE_FILE.read_text())
+        _batch_state = _BatchState(
+            completed=dict.fromkeys(state["completed"]),
+            failed=dict.fromkeys(state["failed"]),
+            errors={key: list(errors) for key, errors in state["errors"].items()},
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return
+
+
+def _start_queued_sessions(batch_state: _BatchState) -> None:
+    """Submits queued sessions to the batch executor until all processing slots are occupied.
+
+    Notes:
+        This function must be called while holding the batch state lock.
+
+    Args:
+        batch_state: The state of the batch whose queued sessions to start.
     """
-    timer = PrecisionTimer(precision=TimerPrecisions.MILLISECOND)
+    if batch_state.executor is None:
+        return
 
-    if _batch_state is None:
+    while len(batch_state.active) < batch_state.max_parallel and batch_state.queued:
+        session_key = batch_state.queued.popleft()
+        session_path = Path(session_key)
+        batch_state.queued_set.discard(session_key)
+
+        # Assigns the session one of the free CPU core sets, if CPU affinity is supported.
+        cpu_set = batch_state.free_cpu_sets.pop() if batch_state.free_cpu_sets else None
+
+        try:
+            future = batch_state.executor.submit(
+                _run_session_processing,
+                session_path=session_path,
+                job_flags=batch_state.job_flags,
+                workers=batch_state.workers,
+                cpu_set=cpu_set,
+            )
+        except BrokenProcessPool as error:
+            # If a session worker process terminates abruptly, the executor can no longer start new sessions. In this
+            # case, marks the session as failed and returns its CPU core set to the pool of free sets.
+            batch_state.failed[session_key] = None
+            batch_state.errors[session_key] = [f"Session processing failed - {type(error).__name__}: {error}"]
+            if cpu_set is not None:
+                batch_state.free_cpu_sets.append(cpu_set)
+            continue
+
+        if cpu_set is not None:
+            batch_state.session_cpu_sets[session_key] = cpu_set
+        batch_state.active[session_key] = future
+        future.add_done_callback(partial(_schedule_session_finalization, batch_state, session_path))
+
+
+def _schedule_session_finalization(
+    batch_state: _BatchState, session_path: Path, future: Future[tuple[bool, list[str]]]
+) -> None:
+    """Schedules the finalization of a session that finished processing.
+
+    This function is called as the done callback of each submitted session future. Done callbacks run in the batch
+    executor's management thread or, for futures that are already done, in the thread that registers them, which may
+    be the event loop thread. Therefore, the callback only hands the finalization, which performs blocking file I/O,
+    to the I/O thread pool.
+
+    Args:
+        batch_state: The state of the batch that the processed session belongs to.
+        session_path: The path to the processed session's data directory.
+        future: The future that executed the session's processing pipeline.
+    """
+    _io_executor.submit(_finalize_session, batch_state, session_path, future)
+
+
+def _finalize_session(batch_state: _BatchState, session_path: Path, future: Future[tuple[bool, list[str]]]) -> None:
+    """Updates the batch state once a session finishes processing and starts the next queued session.
+
+    This function is scheduled to run in the I/O thread pool by the done callback of each submitted session future.
+
+    Args:
+        batch_state: The state of the batch that the processed session belongs to.
+        session_path: The path to the processed session's data directory.
+        future: The future that executed the session's processing pipeline.
+    """
+    session_key = str(session_path)
+
+    # _run_session_processing handles all processing errors internally, so an exception here indicates that the
+    # session could not be processed at all.
+    error = future.exception()
+    if error is None:
+        success, errors = future.result()
+    else:
+        success, errors = False, [f"Session processing failed - {type(error).__name__}: {error}"]
+
+    with batch_state.lock:
+        # Removes from active, adds to completed or failed. Also releases the session's CPU core set.
+        batch_state.active.pop(session_key, None)
+        cpu_set = batch_state.session_cpu_sets.pop(session_key, None)
+        if cpu_set is not None:
+            batch_state.free_cpu_sets.append(cpu_set)
+        if success:
+            batch_state.completed[session_key] = None
+        else:
+            batch_state.failed[session_key] = None
+            if errors:
+                batch_state.errors[session_key] = errors
+
+        # Starts the next queued session in the freed slot. Once all sessions are processed, releases the executor's
+        # worker processes.
+        _start_queued_sessions(batch_state=batch_state)
+        if not batch_state.active and not batch_state.queued and batch_state.executor is not None:
+            batch_state.executor.shutdown(wait=False)
+
+        # Persists the updated batch results, so that they survive server restarts.
+        _save_batch_state(batch_state=batch_state)
+
+    # Resolves the final status of the session once and caches it. Since the session's tracker file no longer
+    # changes after processing ends, status queries can reuse the cached status instead of re-reading the tracker.
+    # The tracker file is parsed anew to ensure that the final status reflects the last write to the file.
+    final_status = _get_session_status(session_path=session_path, refresh=True)
+    with batch_state.lock:
+        batch_state.terminal_status_cache[session_key] = final_status
+
+    # Evicts the session's cached tracker instance, as status queries use the cached final status from now on. If the
+    # session data cannot be loaded, its tracker was never cached.
+    try:
+        session = _load_session(session_path=session_path)
+    except Exception:
         return
+    with _tracker_cache_lock:
+        _tracker_cache.pop(str(session.tracking_data.tracking_data_path.joinpath(ProcessingTrackers.BEHAVIOR)), None)
 
-    while True:
-        with _batch_state.lock:
-            # Cleans up finished threads from active.
-            finished_keys = [key for key, thread in _batch_state.active.items() if not thread.is_alive()]
-            for key in finished_keys:
-                _batch_state.active.pop(key, None)
-
-            # Checks if we're done (no active, no queued).
-            if not _batch_state.active and not _batch_state.queued:
-                break
-
-            # Starts new sessions if we have capacity.
-            while len(_batch_state.active) < _batch_state.max_parallel and _batch_state.queued:
-                next_session = _batch_state.queued.pop(0)
-                session_key = str(next_session)
-
-                thread = Thread(
-                    target=_session_worker,
-                    kwargs={
-                        "session_path": next_session,
-                        "job_flags": _batch_state.job_flags,
-                        "workers": _batch_state.workers,
-                    },
-                    daemon=True,
-                )
-                thread.start()
-                _batch_state.active[session_key] = thread
-
-        # Sleeps briefly before checking again.
-        timer.delay(delay=1000, allow_sleep=True)
-
-
-def _get_session_status(session_path: Path) -> dict[str, Any]:
+
+def _is_directory(path: str) -> bool:
+    """Determines whether the input path points to an existing directory.
+
+    Uses a single stat() call to check both the existence and the type of the path.
+
+    Args:
+        path: The path to check.
+
+    Returns:
+        True if the path points to an existing directory, False otherwise.
+    """
+    return Path(path).is_dir()
+
+
+def _get_job_name_map(session_root: Path, session_name: str) -> dict[str, str]:
+    """Returns the mapping of processing job IDs to base job names for the target session.
+
+    Job IDs are derived from the session's root path and name, neither of which change for a given session. Therefore,
+    the mapping is only computed the first time it is requested for each session and is reused by all later calls.
+
+    Args:
+        session_root: The path to the session's root data directory.
+        session_name: The unique identifier of the session.
+
+    Returns:
+        A dictionary that maps job IDs to their base job names (from BehaviorJobNames).
+    """
+    cache_key = (str(session_root), session_name)
+    with _job_name_cache_lock:
+        id_to_name = _job_name_cache.get(cache_key)
+
+    if id_to_name is None:
+        job_names = _generate_job_names(session_name=session_name, base_job_names=list(_BEHAVIOR_JOB_NAMES))
+        id_to_name = {
+            ProcessingTracker.generate_job_id(session_path=session_root, job_name=full_job_name): base_job_name
+            for base_job_name, full_job_name in job_names.items()
+        }
+        with _job_name_cache_lock:
+            # Evicts the oldest cached mapping if the cache is full.
+            if cache_key not in _job_name_cache and len(_job_name_cache) >= _MAXIMUM_CACHED_SESSIONS:
+                del _job_name_cache[next(iter(_job_name_cache))]
+            _job_name_cache[cache_key] = id_to_name
+
+    return id_to_name
+
+
+def _load_tracker(tracker_path: Path, *, refresh: bool = False) -> ProcessingTracker | None:
+    """Loads the processing tracker stored at the specified path.
+
+    Reuses the previously parsed tracker instance if the tracker file has not changed since it was parsed, so that
+    repeated status queries only need to stat the file instead of re-parsing it.
+
+    Args:
+        tracker_path: The path to the processing tracker .yaml file.
+        refresh: Determines whether to always parse the tracker file, bypassing the cache. Since the cache detects
+            changes using the file's modification time and size, it can miss a final write that keeps the file's size
+            on filesystems with coarse modification times.
+
+    Returns:
+        The loaded ProcessingTracker instance or None if the tracker file does not exist.
+    """
+    try:
+        file_stats = tracker_path.stat()
+    except FileNotFoundError:
+        return None
+
+    if refresh:
+        return ProcessingTracker.from_yaml(file_path=tracker_path)
+
+    cache_key = str(tracker_path)
+    with _tracker_cache_lock:
+        cached = _tracker_cache.get(cache_key)
+
+    if cached is not None and cached[0] == file_stats.st_mtime_ns and cached[1] == file_stats.st_size:
+        return cached[2]
+
+    tracker = ProcessingTracker.from_yaml(file_path=tracker_path)
+    with _tracker_cache_lock:
+        # Evicts the oldest cached tracker if the cache is full.
+        if cache_key not in _tracker_cache and len(_tracker_cache) >= _MAXIMUM_CACHED_SESSIONS:
+            del _tracker_cache[next(iter(_tracker_cache))]
+        _tracker_cache[cache_key] = (file_stats.st_mtime_ns, file_stats.st_size, tracker)
+    return tracker
+
+
+def _create_empty_status(session_name: str, status: str) -> dict[str, Any]:
+    """Creates the status dictionary for a session that has no tracked processing jobs.
+
+    Args:
+        session_name: The display name of the session.
+        status: The status to report for the session.
+
+    Returns:
+        A dictionary containing session_name, status, progress (completed/total), current_job, and job_details.
+    """
+    return {
+        "session_name": session_name,
+        "status": status,
+        "completed": 0,
+        "total": 0,
+        "current_job": "-",
+        "job_details": [],
+    }
+
+
+def _get_session_status(session_path: Path, *, refresh: bool = False) -> dict[str, Any]:
     """Retrieves the processing status for a single session.
 
     Args:
         session_path: The path to the session's data directory.
+        refresh: Determines whether to parse the session's tracker file even if a cached tracker instance is
+            available.
 
     Returns:
         A dictionary containing session_name, status, progress (completed/total), current_job, job_details, and errors.
@@ -295,8 +692,8 @@ def _get_session_status(session_path: Path) -> dict[str, Any]:
 
     if _batch_state is not None:
         with _batch_state.lock:
-            is_queued = session_path in _batch_state.queued
-            is_active = session_key in _batch_state.active and _batch_state.active[session_key].is_alive()
+            is_queued = session_key in _batch_state.queued_set
+            is_active = session_key in _batch_state.active
             is_completed = session_key in _batch_state.completed
             is_failed = session_key in _batch_state.failed
             session_errors = _batch_state.errors.get(session_key, [])
@@ -306,100 +703,52 @@ def _get_session_status(session_path: Path) -> dict[str, Any]:
 
     # If queued, returns early with QUEUED status.
     if is_queued:
-        return {
-            "session_name": session_display_name,
-            "status": "QUEUED",
-            "completed": 0,
-            "total": 0,
-            "current_job": "-",
-            "job_details": [],
-        }
+        return _create_empty_status(session_name=session_display_name, status="QUEUED")
 
     # Loads the session data to find the tracker file.
     try:
-        session = SessionData.load(session_path=session_path)
+        session = _load_session(session_path=session_path)
     except Exception:
-        return {
-            "session_name": session_display_name,
-            "status": "ERROR",
-            "completed": 0,
-            "total": 0,
-            "current_job": "-",
-            "job_details": [],
-        }
+        return _create_empty_status(session_name=session_display_name, status="ERROR")
 
-    tracker_path = session.tracking_data.tracking_data_path.joinpath(ProcessingTrackers.BEHAVIOR)
-
-    if not tracker_path.exists():
-        return {
-            "session_name": session_display_name,
-            "status": "NOT_STARTED",
-            "completed": 0,
-            "total": 0,
-            "current_job": "-",
-            "job_details": [],
-        }
+    tracker = _load_tracker(
+        tracker_path=session.tracking_data.tracking_data_path.joinpath(ProcessingTrackers.BEHAVIOR), refresh=refresh
+    )
 
-    tracker = ProcessingTracker.from_yaml(file_path=tracker_path)
+    if tracker is None or not tracker.jobs:
+        return _create_empty_status(session_name=session_display_name, status="NOT_STARTED")
 
-    if not tracker.jobs:
-        return {
-            "session_name": session_display_name,
-            "status": "NOT_STARTED",
-            "completed": 0,
-            "total": 0,
-            "current_job": "-",
-            "job_details": [],
-        }
+    # Resolves the reverse mapping from job_id to base_job_name using the canonical session root path.
+    id_to_name = _get_job_name_map(session_root=get_session_root(session), session_name=session.session_name)
 
-    # Generates reverse mapping from job_id to base_job_name using the canonical session root path.
-    session_root = get_session_root(session)
-    session_name = session.session_name
-    id_to_name: dict[str, str] = {}
-    for base_job_name in BehaviorJobNames:
-        full_job_name = f"{session_name}_{base_job_name}"
-        job_id = ProcessingTracker.generate_job_id(session_path=session_root, job_name=full_job_name)
-        id_to_name[job_id] = base_job_name
-
-    # Counts job statuses.
-    succeeded_count = 0
-    failed_count = 0
-    pending_count = 0
-    running_count = 0
+    # Counts job statuses in a single pass, translating each job's status into its display label.
+    label_counts: Counter[str] = Counter()
     total_count = len(tracker.jobs)
     current_job = "-"
     job_details: list[tuple[str, str]] = []
 
     for job_id, job_state in tracker.jobs.items():
         job_name = id_to_name.get(job_id, job_id[:8])
-
-        if job_state.status == ProcessingStatus.SUCCEEDED:
-            succeeded_count += 1
-            job_details.append((job_name, "done"))
-        elif job_state.status == ProcessingStatus.FAILED:
-            failed_count += 1
-            job_details.append((job_name, "failed"))
-        elif job_state.status == ProcessingStatus.RUNNING:
-            running_count += 1
+        job_label = _JOB_STATUS_LABELS.get(job_state.status, "pending")
+        label_counts[job_label] += 1
+        job_details.append((job_name, job_label))
+        if job_label == "running":
             current_job = job_name
-            job_details.append((job_name, "running"))
-        else:
-            pending_count += 1
-            job_details.append((job_name, "pending"))
-
-    # Determines overall status.
-    if is_active or running_count > 0:
-        status = "PROCESSING"
-    elif is_failed or (failed_count > 0 and succeeded_count == 0):
-        status = "FAILED"
-    elif failed_count > 0 and succeeded_count > 0:
-        status = "PARTIAL"
-    elif is_completed or succeeded_count == total_count:
-        status = "SUCCEEDED"
-    elif pending_count > 0:
-        status = "PENDING"
-    else:
-        status = "UNKNOWN"
+
+    succeeded_count = label_counts["done"]
+    failed_count = label_counts["failed"]
+    pending_count = label_counts["pending"]
+    running_count = label_counts["running"]
+
+    # Determines overall status. Each status condition sets one bit of the lookup key, ordered by the status priority.
+    status_key = (
+        (is_active or running_count > 0)
+        | (is_failed or (failed_count > 0 and succeeded_count == 0)) << 1
+        | (failed_count > 0 and succeeded_count > 0) << 2
+        | (is_completed or succeeded_count == total_count) << 3
+        | (pending_count > 0) << 4
+    )
+    status = _STATUS_TABLE[status_key]
 
     result: dict[str, Any] = {
         "session_name": session_display_name,
@@ -416,12 +765,49 @@ def _get_session_status(session_path: Path) -> dict[str, Any]:
     return result
 
 
-@mcp.tool()
-def discover_sessions_tool(root_directory: str) -> dict[str, Any]:
-    """Discovers all sessions in a directory tree that may need processing.
+def _find_session_data_files(root_directory: Path) -> list[Path]:
+    """Finds all session_data.yaml files stored under the target directory.
 
-    Searches for session_data.yaml files to identify session directories. For each found session, resolves and returns
-    the canonical session root path (parent of raw_data). These paths can be passed directly to start_processing_tool.
+    Walks the directory tree iteratively with os.scandir(), which reuses the file type information returned by the
+    directory listing instead of issuing a separate stat() call for each entry. Symbolic links to directories are not
+    followed. Since sessions are not nested inside each other, the subdirectories of a directory that contains a
+    session_data.yaml file are not searched.
+
+    Args:
+        root_directory: The path to the root directory to search.
+
+    Returns:
+        The list of paths to the discovered session_data.yaml files.
+    """
+    session_files: list[Path] = []
+    pending_directories: list[str] = [str(root_directory)]
+    while pending_directories:
+        directory = pending_directories.pop()
+        subdirectories: list[str] = []
+        session_file: str | None = None
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                    elif entry.name == "session_data.yaml":
+                        session_file = entry.path
+        except OSError:
+            continue  # Skips directories that cannot be listed.
+
+        # Prunes the subtree below each discovered session data directory, as it only stores the session's data files.
+        if session_file is not None:
+            session_files.append(Path(session_file))
+        else:
+            pending_directories.extend(subdirectories)
+    return session_files
+
+
+def _discover_sessions(root_directory: str) -> dict[str, Any]:
+    """Discovers all processable sessions in the target directory tree.
+
+    This is the blocking implementation of discover_sessions_tool, which runs it in a worker thread. The thread must not
+    belong to the I/O thread pool, as this function waits for the session loads it submits to that pool.
 
     Args:
         root_directory: The absolute path to the root directory to search.
@@ -442,10 +828,18 @@ def discover_sessions_tool(root_directory: str) -> dict[str, Any]:
     skipped: list[str] = []
     errors: list[str] = []
 
-    for yaml_file in root_path.rglob("session_data.yaml"):
+    # Loads all discovered sessions in parallel. Each load is dominated by reading and parsing the session's .yaml
+    # files, so the loads are carried out by the I/O thread pool.
+    session_directories = [yaml_file.parent for yaml_file in _find_session_data_files(root_directory=root_path)]
+    session_futures = [
+        _io_executor.submit(SessionData.load, session_path=session_directory)
+        for session_directory in session_directories
+    ]
+
+    for session_directory, session_future in zip(session_directories, session_futures, strict=True):
         try:
-            # Loads the session and resolves to the canonical root path.
-            session = SessionData.load(session_path=yaml_file.parent)
+            # Waits for the session to load and resolves it to the canonical root path.
+            session = session_future.result()
             session_root = get_session_root(session=session)
 
             # Filters out sessions that don't contain processable behavior data.
@@ -455,7 +849,7 @@ def discover_sessions_tool(root_directory: str) -> dict[str, Any]:
 
             session_paths.append(str(session_root))
         except Exception as error:
-            errors.append(f"{yaml_file.parent}: {error}")
+            errors.append(f"{session_directory}: {error}")
 
     # Sorts paths for consistent output.
     session_paths.sort()
@@ -474,8 +868,102 @@ def discover_sessions_tool(root_directory: str) -> dict[str, Any]:
     return result
 
 
+def _start_batch(session_keys: list[str], job_flags: dict[str, bool], workers: int) -> dict[str, Any]:
+    """Creates the state of a new processing batch and starts processing its first sessions.
+
+    Notes:
+        This function carries out blocking file I/O and starts the session worker processes, so the MCP tools call it
+        in the I/O thread pool. It holds the batch start lock while it runs, so that concurrent tool calls cannot start
+        two batches at the same time.
+
+    Args:
+        session_keys: The normalized paths to the data directories of the sessions to process.
+        job_flags: Dictionary mapping job names to whether they should run.
+        workers: The requested number of CPU cores to use per job. Set to -1 for automatic allocation.
+
+    Returns:
+        A dictionary that describes the started batch, or a dictionary that describes the error if another batch is
+        still being processed.
+    """
+    global _batch_state
+
+    with _batch_start_lock:
+        # Checks if processing is already active.
+        if _batch_state is not None:
+            with _batch_state.lock:
+                if _batch_state.active or _batch_state.queued:
+                    return {
+                        "error": "Processing already in progress. Wait for current batch to complete or check status.",
+                        "active_count": len(_batch_state.active),
+                        "queued_count": len(_batch_state.queued),
+                    }
+
+        # Clears the caches filled while processing the previous batch. All state of the previous batch is discarded
+        # when the new batch state is created below.
+        with _job_name_cache_lock:
+            _job_name_cache.clear()
+        with _tracker_cache_lock:
+            _tracker_cache.clear()
+
+        # Calculates resource allocation.
+        job_workers = _calculate_job_workers(requested_workers=workers)
+        max_parallel = _calculate_max_parallel_sessions()
+
+        # Initializes batch state.
+        batch_state = _BatchState(
+            queued=deque(session_keys),
+            queued_set=set(session_keys),
+            active={},
+            completed={},
+            failed={},
+            job_flags=job_flags,
+            workers=job_workers,
+            max_parallel=max_parallel,
+            executor=ProcessPoolExecutor(max_workers=max_parallel, mp_context=get_context(_SESSION_START_METHOD)),
+            free_cpu_sets=_compute_session_cpu_sets(max_parallel=max_parallel),
+        )
+        _batch_state = batch_state
+
+        # Submits the first batch of sessions for processing. The remaining sessions are started as earlier sessions
+        # finish processing. Also overwrites the persisted results of the previous batch.
+        with batch_state.lock:
+            _save_batch_state(batch_state=batch_state)
+            _start_queued_sessions(batch_state=batch_state)
+
+    # Calculates how many will start immediately vs queue.
+    immediate_start = min(len(session_keys), max_parallel)
+    queued_count = len(session_keys) - immediate_start
+
+    return {
+        "started": True,
+        "total_sessions": len(session_keys),
+        "immediate_start": immediate_start,
+        "queued": queued_count,
+        "max_parallel": max_parallel,
+        "workers_per_session": job_workers,
+    }
+
+
 @mcp.tool()
-def get_processing_status_tool() -> dict[str, Any]:
+async def discover_sessions_tool(root_directory: str) -> dict[str, Any]:
+    """Discovers all sessions in a directory tree that may need processing.
+
+    Searches for session_data.yaml files to identify session directories. For each found session, resolves and returns
+    the canonical session root path (parent of raw_data). These paths can be passed directly to start_processing_tool.
+
+    Args:
+        root_directory: The absolute path to the root directory to search.
+
+    Returns:
+        A dictionary containing a list of discovered session root paths and the total count.
+    """
+    # Walks the directory tree and parses the session files in a worker thread, so that the server's event loop remains
+    # free to serve other tool calls.
+    return await asyncio.to_thread(_discover_sessions, root_directory=root_directory)
+
+
+@mcp.tool()
+async def get_processing_status_tool() -> dict[str, Any]:
     """Returns the current processing status for all sessions being managed.
 
     Returns status for active, queued, and completed sessions. If no batch processing is active, returns an empty
@@ -498,46 +986,56 @@ def get_processing_status_tool() -> dict[str, Any]:
             },
         }
 
-    session_statuses: list[dict[str, Any]] = []
-
     with _batch_state.lock:
-        # Collects all session paths from active, queued, completed, and failed sets.
-        all_sessions: list[Path] = [Path(key) for key in _batch_state.active]
-        all_sessions.extend(_batch_state.queued)
-        all_sessions.extend(Path(key) for key in _batch_state.completed)
-
-        # Adds failed sessions that aren't already included.
-        existing_keys = {str(path) for path in all_sessions}
-        all_sessions.extend(Path(key) for key in _batch_state.failed if key not in existing_keys)
-
-        queued_count = len(_batch_state.queued)
-        processing_count = len(_batch_state.active)
-        succeeded_count = len(_batch_state.completed)
-        failed_count = len(_batch_state.failed)
-
-    # Gets status for each session (outside lock to avoid blocking).
-    for session_path in all_sessions:
-        status = _get_session_status(session_path=session_path)
-        session_statuses.append(status)
+        # Snapshots the batch state, releasing the lock as soon as possible to avoid blocking session updates.
+        active_keys = list(_batch_state.active)
+        queued_keys = list(dict.fromkeys(_batch_state.queued))
+        completed_keys = list(_batch_state.completed)
+        failed_keys = list(_batch_state.failed)
+
+        # Copies the cached statuses of sessions that finished processing.
+        terminal_statuses = dict(_batch_state.terminal_status_cache)
+
+    # Resolves the statuses of active sessions and of finished sessions whose final status is not cached yet (outside
+    # lock to avoid blocking). Since these queries read tracker files, they are carried out in parallel in the I/O
+    # thread pool without blocking the server's event loop.
+    finished_keys = completed_keys + failed_keys
+    uncached_keys = active_keys + [key for key in finished_keys if key not in terminal_statuses]
+    loop = asyncio.get_running_loop()
+    resolved_statuses = dict(
+        zip(
+            uncached_keys,
+            await asyncio.gather(
+                *(loop.run_in_executor(_io_executor, _get_session_status, Path(key)) for key in uncached_keys)
+            ),
+            strict=True,
+        )
+    )
 
-    # Sorts sessions: processing first, then queued, then completed/failed.
-    status_order = {"PROCESSING": 0, "QUEUED": 1, "PENDING": 2, "SUCCEEDED": 3, "PARTIAL": 4, "FAILED": 5}
-    session_statuses.sort(key=lambda s: (status_order.get(s["status"], 99), s["session_name"]))
+    # Assembles the session statuses in display order: processing sessions first, then queued, completed, and failed
+    # sessions. Since the status of each group is known in advance, queued sessions do not require reading their
+    # tracker files and the output does not need to be sorted. Within each group, sessions are listed in the order they
+    # were queued or finished processing.
+    session_statuses: list[dict[str, Any]] = [resolved_statuses[key] for key in active_keys]
+    session_statuses.extend(_create_empty_status(session_name=Path(key).name, status="QUEUED") for key in queued_keys)
+    session_statuses.extend(
+        terminal_statuses[key] if key in terminal_statuses else resolved_statuses[key] for key in finished_keys
+    )
 
     return {
         "sessions": session_statuses,
         "summary": {
-            "total": len(all_sessions),
-            "succeeded": succeeded_count,
-            "failed": failed_count,
-            "processing": processing_count,
-            "queued": queued_count,
+            "total": len(session_statuses),
+            "succeeded": len(completed_keys),
+            "failed": len(failed_keys),
+            "processing": len(active_keys),
+            "queued": len(queued_keys),
         },
     }
 
 
 @mcp.tool()
-def start_processing_tool(
+async def start_processing_tool(
     session_paths: list[str],
     *,
     process_runtime: bool = True,
@@ -569,35 +1067,27 @@ def start_processing_tool(
     Returns:
         A dictionary containing confirmation of started sessions, queued sessions, and worker allocation.
     """
-    global _batch_state
-
     if not session_paths:
         return {"error": "At least one session path is required"}
 
-    # Validates all session paths exist.
-    valid_paths: list[Path] = []
+    # Validates that all session paths point to existing directories. Since each check is an I/O-bound stat() call,
+    # the checks are carried out in parallel in the I/O thread pool without blocking the server's event loop.
+    valid_keys: list[str] = []
     invalid_paths: list[str] = []
 
-    for session_path in session_paths:
-        path = Path(session_path)
-        if path.exists():
-            valid_paths.append(path)
+    loop = asyncio.get_running_loop()
+    validity = await asyncio.gather(
+        *(loop.run_in_executor(_io_executor, _is_directory, path) for path in session_paths)
+    )
+    for session_path, is_valid in zip(session_paths, validity, strict=True):
+        if is_valid:
+            valid_keys.append(str(Path(session_path)))  # Normalizes the path before using it as the session key
         else:
             invalid_paths.append(session_path)
 
-    if not valid_paths:
+    if not valid_keys:
         return {"error": "No valid session paths provided", "invalid_paths": invalid_paths}
 
-    # Checks if processing is already active.
-    if _batch_state is not None:
-        with _batch_state.lock:
-            if _batch_state.active or _batch_state.queued:
-                return {
-                    "error": "Processing already in progress. Wait for current batch to complete or check status.",
-                    "active_count": len(_batch_state.active),
-                    "queued_count": len(_batch_state.queued),
-                }
-
     # Builds job flags dictionary.
     job_flags: dict[str, bool] = {
         BehaviorJobNames.RUNTIME: process_runtime,
@@ -610,44 +1100,15 @@ def start_processing_tool(
 
     # If all flags are False, treats as all True.
     if not any(job_flags.values()):
-        job_flags = dict.fromkeys(job_flags, True)
-
-    # Calculates resource allocation.
-    job_workers = _calculate_job_workers(requested_workers=workers)
-    max_parallel = _calculate_max_parallel_sessions()
-
-    # Initializes batch state.
-    _batch_state = _BatchState(
-        queued=list(valid_paths),
-        active={},
-        completed=set(),
-        failed=set(),
-        job_flags=job_flags,
-        workers=job_workers,
-        max_parallel=max_parallel,
-        lock=Lock(),
-        manager_thread=None,
-    )
-
-    # Starts the batch manager thread.
-    manager = Thread(target=_batch_manager, daemon=True)
-    manager.start()
-    _batch_state.manager_thread = manager
+        job_flags = dict.fromkeys(_BEHAVIOR_JOB_NAMES, True)
 
-    # Calculates how many will start immediately vs queue.
-    immediate_start = min(len(valid_paths), max_parallel)
-    queued_count = len(valid_paths) - immediate_start
-
-    result: dict[str, Any] = {
-        "started": True,
-        "total_sessions": len(valid_paths),
-        "immediate_start": immediate_start,
-        "queued": queued_count,
-        "max_parallel": max_parallel,
-        "workers_per_session": job_workers,
-    }
+    # Starts the batch in the I/O thread pool, as starting the batch reads the CPU topology, writes the batch state
+    # file, and starts the session worker processes.
+    result = await loop.run_in_executor(
+        _io_executor, partial(_start_batch, session_keys=valid_keys, job_flags=job_flags, workers=workers)
+    )
 
-    if invalid_paths:
+    if invalid_paths and "error" not in result:
         result["invalid_paths"] = invalid_paths
 
     return result
@@ -659,4 +1120,6 @@ def run_server(transport: Literal["stdio", "sse", "streamable-http"] = "stdio")
     Args:
         transport: The transport type to use ('stdio', 'sse', or 'streamable-http').
     """
+    # Restores the results of the batch processed before the server was last shut down.
+    _restore_batch_state()
     mcp.run(transport=transport)
@@ -1,15 +1,19 @@
 from typing import Any, Literal
 from pathlib import Path
-from threading import Lock, Thread
+from threading import Lock
+from collections import deque
 from dataclasses import field, dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 
 from _typeshed import Incomplete
-from sl_shared_assets import SessionTypes, ProcessingTracker
+from sl_shared_assets import SessionData, SessionTypes, ProcessingStatus, ProcessingTracker
 
 from .pipeline import (
     BehaviorJobNames as BehaviorJobNames,
     _execute_job as _execute_job,
     get_session_root as get_session_root,
+    _generate_job_names as _generate_job_names,
+    _get_available_cores as _get_available_cores,
     _resolve_available_jobs as _resolve_available_jobs,
     _initialize_processing_tracker as _initialize_processing_tracker,
 )
@@ -17,35 +21,72 @@ from .pipeline import (
 mcp: Incomplete
 _RESERVED_CORES: int
 _MAXIMUM_JOB_CORES: int
+_MAXIMUM_IO_THREADS: int
+_BEHAVIOR_JOB_NAMES: tuple[BehaviorJobNames, ...]
+_JOB_STATUS_LABELS: dict[ProcessingStatus, str]
+_STATUS_PRIORITY: tuple[str, ...]
+_STATUS_TABLE: tuple[str, ...]
+_MAXIMUM_CACHED_SESSIONS: int
+_BATCH_STATE_FILE: Path
+_SESSION_START_METHOD: str
+_NUMA_NODE_DIRECTORY: Path
 _PROCESSABLE_SESSION_TYPES: frozenset[SessionTypes]
 
 @dataclass
 class _BatchState:
-    queued: list[Path] = field(default_factory=list)
-    active: dict[str, Thread] = field(default_factory=dict)
-    completed: set[str] = field(default_factory=set)
-    failed: set[str] = field(default_factory=set)
+    queued: deque[str] = field(default_factory=deque)
+    queued_set: set[str] = field(default_factory=set)
+    active: dict[str, Future[tuple[bool, list[str]]]] = field(default_factory=dict)
+    completed: dict[str, None] = field(default_factory=dict)
+    failed: dict[str, None] = field(default_factory=dict)
     errors: dict[str, list[str]] = field(default_factory=dict)
+    terminal_status_cache: dict[str, dict[str, Any]] = field(default_factory=dict)
     job_flags: dict[str, bool] = field(default_factory=dict)
     workers: int = ...
     max_parallel: int = ...
     lock: Lock = field(default_factory=Lock)
-    manager_thread: Thread | None = ...
+    executor: ProcessPoolExecutor | None = ...
+    free_cpu_sets: list[frozenset[int]] = field(default_factory=list)
+    session_cpu_sets: dict[str, frozenset[int]] = field(default_factory=dict)
+    session_cache: dict[str, SessionData] = field(default_factory=dict)
 
 _batch_state: _BatchState | None
+_batch_start_lock: Lock
+_io_executor: ThreadPoolExecutor
+_job_name_cache: dict[tuple[str, str], dict[str, str]]
+_job_name_cache_lock: Lock
+_tracker_cache: dict[str, tuple[int, int, ProcessingTracker]]
+_tracker_cache_lock: Lock
 
 def _calculate_job_workers(requested_workers: int) -> int: ...
 def _calculate_max_parallel_sessions() -> int: ...
+def _parse_cpu_list(cpu_list: str) -> list[int]: ...
+def _compute_session_cpu_sets(max_parallel: int) -> list[frozenset[int]]: ...
+def _load_session(session_path: Path) -> SessionData: ...
 def _execute_single_job(
-    session_path: Path, base_job_name: str, session_name: str, job_id: str, workers: int, tracker: ProcessingTracker
+    session_path: Path, base_job_name: str, job_id: str, workers: int, tracker: ProcessingTracker
 ) -> tuple[str, bool, str | None]: ...
-def _run_session_processing(session_path: Path, job_flags: dict[str, bool], workers: int) -> tuple[bool, list[str]]: ...
-def _session_worker(session_path: Path, job_flags: dict[str, bool], workers: int) -> None: ...
-def _batch_manager() -> None: ...
-def _get_session_status(session_path: Path) -> dict[str, Any]: ...
-def discover_sessions_tool(root_directory: str) -> dict[str, Any]: ...
-def get_processing_status_tool() -> dict[str, Any]: ...
-def start_processing_tool(
+def _run_session_processing(
+    session_path: Path, job_flags: dict[str, bool], workers: int, cpu_set: frozenset[int] | None = None
+) -> tuple[bool, list[str]]: ...
+def _save_batch_state(batch_state: _BatchState) -> None: ...
+def _restore_batch_state() -> None: ...
+def _start_queued_sessions(batch_state: _BatchState) -> None: ...
+def _schedule_session_finalization(
+    batch_state: _BatchState, session_path: Path, future: Future[tuple[bool, list[str]]]
+) -> None: ...
+def _finalize_session(batch_state: _BatchState, session_path: Path, future: Future[tuple[bool, list[str]]]) -> None: ...
+def _is_directory(path: str) -> bool: ...
+def _get_job_name_map(session_root: Path, session_name: str) -> dict[str, str]: ...
+def _load_tracker(tracker_path: Path, *, refresh: bool = False) -> ProcessingTracker | None: ...
+def _create_empty_status(session_name: str, status: str) -> dict[str, Any]: ...
+def _get_session_status(session_path: Path, *, refresh: bool = False) -> dict[str, Any]: ...
+def _find_session_data_files(root_directory: Path) -> list[Path]: ...
+def _discover_sessions(root_directory: str) -> dict[str, Any]: ...
+def _start_batch(session_keys: list[str], job_flags: dict[str, bool], workers: int) -> dict[str, Any]: ...
+async def discover_sessions_tool(root_directory: str) -> dict[str, Any]: ...
+async def get_processing_status_tool() -> dict[str, Any]: ...
+async def start_processing_tool(
     session_paths: list[str],
     *,
     process_runtime: bool = True,
@@ -81,12 +81,12 @@ def _parse_encoder_data(
     displacements: NDArray[np.float64] = np.empty(total_length, dtype=np.float64)
 
     # Processes CCW rotations (Code 51). CCW rotation is interpreted as positive displacement
-    timestamps[:ccw_count] = np.array([msg.timestamp for msg in ccw_data], dtype=np.uint64)
-    displacements[:ccw_count] = np.array([msg.data for msg in ccw_data], dtype=np.float64)
+    timestamps[:ccw_count] = np.fromiter((msg.timestamp for msg in ccw_data), dtype=np.uint64, count=ccw_count)
+    displacements[:ccw_count] = np.fromiter((msg.data for msg in ccw_data), dtype=np.float64, count=ccw_count)
 
     # Processes CW rotations (Code 52). CW rotation is interpreted as negative displacement
-    timestamps[ccw_count:] = np.array([msg.timestamp for msg in cw_data], dtype=np.uint64)
-    displacements[ccw_count:] = -np.array([msg.data for msg in cw_data], dtype=np.float64)
+    timestamps[ccw_count:] = np.fromiter((msg.timestamp for msg in cw_data), dtype=np.uint64, count=cw_count)
+    displacements[ccw_count:] = -np.fromiter((msg.data for msg in cw_data), dtype=np.float64, count=cw_count)
 
     # Sorts both arrays based on timestamps.
     sort_indices = np.argsort(timestamps)
@@ -98,8 +98,9 @@ def _parse_encoder_data(
     # start of the experimental trial (beginning of the VR track) as 0-value. Positive positions mean moving forward
     # along the track, negative positions mean moving backward along the track.
     # noinspection PyTypeChecker
-    positions = np.cumsum(displacements * cm_per_pulse)
-    positions = np.round(positions, decimals=8)
+    np.multiply(displacements, cm_per_pulse, out=displacements)
+    positions = np.cumsum(displacements, out=displacements)
+    np.round(positions, decimals=8, out=positions)
 
     # Replaces -0.0 values with 0.0. This is a convenience adjustment to improve the visual appearance of the data.
     positions[np.isclose(positions, -0.0) & np.signbit(positions)] = 0.0
@@ -147,11 +148,11 @@ def _parse_ttl_data(extracted_module_data: ExtractedModuleData, output_file: Pat
     triggers: NDArray[np.uint8] = np.empty(total_length, dtype=np.uint8)
 
     # Extracts ON (Code 51) trigger codes. Statically assigns the value '1' to denote ON signals.
-    timestamps[:on_count] = np.array([msg.timestamp for msg in on_data], dtype=np.uint64)
+    timestamps[:on_count] = np.fromiter((msg.timestamp for msg in on_data), dtype=np.uint64, count=on_count)
     triggers[:on_count] = 1  # All ON signals
 
     # Extracts OFF (Code 52) trigger codes.
-    timestamps[on_count:] = np.array([msg.timestamp for msg in off_data], dtype=np.uint64)
+    timestamps[on_count:] = np.fromiter((msg.timestamp for msg in off_data), dtype=np.uint64, count=off_count)
     triggers[on_count:] = 0  # All OFF signals
 
     # Sorts both arrays based on the timestamps, so that the data is in the chronological order.
@@ -217,13 +218,17 @@ def _parse_brake_data(
 
     # Processes Engaged (code 51) triggers. When the motor is engaged, it applies the maximum possible torque to
     # the brake.
-    timestamps[:engaged_count] = np.array([msg.timestamp for msg in engaged_data], dtype=np.uint64)
+    timestamps[:engaged_count] = np.fromiter(
+        (msg.timestamp for msg in engaged_data), dtype=np.uint64, count=engaged_count
+    )
     torques[:engaged_count] = maximum_brake_strength  # Broadcasting scalar value
 
     # Processes Disengaged (code 52) triggers. Contrary to naive expectation, the torque of a disengaged brake is
     # NOT zero. Instead, it is at least the same as the minimum brake strength, likely larger due to all mechanical
     # couplings in the system.
-    timestamps[engaged_count:] = np.array([msg.timestamp for msg in disengaged_data], dtype=np.uint64)
+    timestamps[engaged_count:] = np.fromiter(
+        (msg.timestamp for msg in disengaged_data), dtype=np.uint64, count=disengaged_count
+    )
     torques[engaged_count:] = minimum_brake_strength  # Broadcasting scalar value
 
     # Sorts both arrays based on timestamps.
@@ -303,11 +308,11 @@ def _parse_valve_data(
     # Open/Close cycle duration into the dispensed volume.
 
     # Extracts Open (Code 51) trigger codes. Statically assigns the value '1' to denote Open signals.
-    timestamps[:open_count] = np.array([msg.timestamp for msg in open_data], dtype=np.uint64)
+    timestamps[:open_count] = np.fromiter((msg.timestamp for msg in open_data), dtype=np.uint64, count=open_count)
     volume[:open_count] = 1  # Open state
 
     # Extracts Closed (Code 52) trigger codes.
-    timestamps[open_count:] = np.array([msg.timestamp for msg in closed_data], dtype=np.uint64)
+    timestamps[open_count:] = np.fromiter((msg.timestamp for msg in closed_data), dtype=np.uint64, count=closed_count)
     volume[open_count:] = 0  # Closed state
 
     # Sorts both arrays based on timestamps.
@@ -350,11 +355,15 @@ def _parse_valve_data(
     tone_states: NDArray[np.uint8] = np.empty(tone_length, dtype=np.uint8)
 
     # Extracts ON (Code 54) Tone codes. Statically assigns the value '1' to denote On signals.
-    tone_timestamps[:tone_on_count] = np.array([msg.timestamp for msg in tone_on_data], dtype=np.uint64)
+    tone_timestamps[:tone_on_count] = np.fromiter(
+        (msg.timestamp for msg in tone_on_data), dtype=np.uint64, count=tone_on_count
+    )
     tone_states[:tone_on_count] = 1
 
     # Extracts OFF (Code 55) trigger codes.
-    tone_timestamps[tone_on_count:] = np.array([msg.timestamp for msg in tone_off_data], dtype=np.uint64)
+    tone_timestamps[tone_on_count:] = np.fromiter(
+        (msg.timestamp for msg in tone_off_data), dtype=np.uint64, count=tone_off_count
+    )
     tone_states[tone_on_count:] = 0
 
     # Sorts both arrays based on timestamps.
@@ -435,11 +444,11 @@ def _parse_gas_puff_data(extracted_module_data: ExtractedModuleData, output_file
     states: NDArray[np.uint8] = np.empty(total_length, dtype=np.uint8)
 
     # Extracts Open (Code 51) states.
-    timestamps[:open_count] = np.array([msg.timestamp for msg in open_data], dtype=np.uint64)
+    timestamps[:open_count] = np.fromiter((msg.timestamp for msg in open_data), dtype=np.uint64, count=open_count)
     states[:open_count] = 1  # Open state
 
     # Extracts Closed (Code 52) states.
-    timestamps[open_count:] = np.array([msg.timestamp for msg in closed_data], dtype=np.uint64)
+    timestamps[open_count:] = np.fromiter((msg.timestamp for msg in closed_data), dtype=np.uint64, count=closed_count)
     states[open_count:] = 0  # Closed state
 
     # Sorts both arrays based on timestamps.
@@ -496,8 +505,12 @@ def _parse_lick_data(extracted_module_data: ExtractedModuleData, output_file: Pa
     # Extracts timestamps and voltage levels. Timestamps use uint64 datatype. Lick sensor
     # voltage levels come in as uint16, but they are later used to generate a binary uint8 lick classification mask.
     voltage_data = event_data[np.uint8(51)]
-    timestamps: NDArray[np.uint64] = np.array([msg.timestamp for msg in voltage_data], dtype=np.uint64)
-    voltages: NDArray[np.uint16] = np.array([msg.data for msg in voltage_data], dtype=np.uint16)
+    timestamps: NDArray[np.uint64] = np.fromiter(
+        (msg.timestamp for msg in voltage_data), dtype=np.uint64, count=len(voltage_data)
+    )
+    voltages: NDArray[np.uint16] = np.fromiter(
+        (msg.data for msg in voltage_data), dtype=np.uint16, count=len(voltage_data)
+    )
 
     # Sorts all arrays by timestamp. This is technically not needed as the extracted values are already sorted by
     # timestamp, but this is still done for additional safety.
@@ -561,18 +574,20 @@ def _parse_torque_data(
     cw_count = len(cw_data)
     total_length = ccw_count + cw_count
     timestamps: NDArray[np.uint64] = np.empty(total_length, dtype=np.uint64)
+    torques: NDArray[np.float64] = np.empty(total_length, dtype=np.float64)
 
     # Processes CCW torques (Code 51). CCW torque is interpreted as positive torque
-    timestamps[:ccw_count] = np.array([msg.timestamp for msg in ccw_data], dtype=np.uint64)
-    ccw_values = np.array([msg.data for msg in ccw_data], dtype=np.float64) * torque_per_adc_unit
+    timestamps[:ccw_count] = np.fromiter((msg.timestamp for msg in ccw_data), dtype=np.uint64, count=ccw_count)
+    torques[:ccw_count] = np.fromiter((msg.data for msg in ccw_data), dtype=np.float64, count=ccw_count)
 
     # Processes CW torques (Code 52). CW torque is interpreted as negative torque
-    timestamps[ccw_count:] = np.array([msg.timestamp for msg in cw_data], dtype=np.uint64)
-    cw_values = -np.array([msg.data for msg in cw_data], dtype=np.float64) * torque_per_adc_unit
+    timestamps[ccw_count:] = np.fromiter((msg.timestamp for msg in cw_data), dtype=np.uint64, count=cw_count)
+    torques[ccw_count:] = np.fromiter((msg.data for msg in cw_data), dtype=np.float64, count=cw_count)
+    np.negative(torques[ccw_count:], out=torques[ccw_count:])
 
-    # Combine torques into a unified time-based array
-    torques = np.concatenate([ccw_values, cw_values])
-    torques = np.round(torques, decimals=8)
+    # Converts the combined ADC readouts into Newton centimeters in a single in-place pass over the whole array.
+    np.multiply(torques, torque_per_adc_unit, out=torques)
+    np.round(torques, decimals=8, out=torques)
 
     # Sorts both arrays based on timestamps.
     sort_indices = np.argsort(timestamps)
@@ -642,11 +657,11 @@ def _parse_screen_data(extracted_module_data: ExtractedModuleData, output_file:
     triggers: NDArray[np.uint8] = np.empty(total_length, dtype=np.uint8)
 
     # Extracts ON (Code 51) trigger codes. Statically assigns the value '1' to denote ON signals.
-    timestamps[:on_count] = np.array([msg.timestamp for msg in on_data], dtype=np.uint64)
+    timestamps[:on_count] = np.fromiter((msg.timestamp for msg in on_data), dtype=np.uint64, count=on_count)
     triggers[:on_count] = 1
 
     # Extracts OFF (Code 52) trigger codes.
-    timestamps[on_count:] = np.array([msg.timestamp for msg in off_data], dtype=np.uint64)
+    timestamps[on_count:] = np.fromiter((msg.timestamp for msg in off_data), dtype=np.uint64, count=off_count)
     triggers[on_count:] = 0
 
     # Sorts both arrays based on the timestamps, so that the data is in the chronological order.
@@ -812,7 +827,7 @@ def _extract_mesoscope_vr_actor_data(
         data_indices.append(None)
 
     # Aborts early if no module data needs to be parsed.
-    if set(data_indices) == {None}:
+    if not parse_tasks:
         return
 
     # Extracts the data for the requested hardware modules from the log file.
@@ -820,19 +835,20 @@ def _extract_mesoscope_vr_actor_data(
         log_path=log_path, module_type_id=tuple(module_type_id), n_workers=workers
     )
 
+    # Resolves the extracted data index for each parsing task once, before dispatching the tasks.
+    task_indices = [index for index in data_indices if index is not None]
+
     # Depending on configuration, executes the parsing tasks in-parallel or sequentially.
     if workers == 1 or len(parse_tasks) == 1:
         # Sequential execution
-        for i, task in enumerate(parse_tasks):
-            idx = [d for d in data_indices if d is not None][i]
+        for task, idx in zip(parse_tasks, task_indices, strict=True):
             task["func"](extracted_module_data=log_data_tuple[idx], output_file=task["output"], **task["kwargs"])
     else:
         # Parallel execution
         n_workers = workers if workers > 0 else None  # None uses all available cores
         with ProcessPoolExecutor(max_workers=n_workers) as executor:
             futures = []
-            for i, task in enumerate(parse_tasks):
-                idx = [d for d in data_indices if d is not None][i]
+            for task, idx in zip(parse_tasks, task_indices, strict=True):
                 future = executor.submit(
                     _parse_module_data, task["func"], log_data_tuple[idx], task["output"], **task["kwargs"]
                 )
@@ -916,7 +932,7 @@ def _extract_mesoscope_vr_sensor_data(
         data_indices.append(None)
 
     # Aborts early if no module data needs to be parsed.
-    if set(data_indices) == {None}:
+    if not parse_tasks:
         return
 
     # Extracts the data for all requested modules in parallel
@@ -924,19 +940,20 @@ def _extract_mesoscope_vr_sensor_data(
         log_path=log_path, module_type_id=tuple(module_type_id), n_workers=workers
     )
 
+    # Resolves the extracted data index for each parsing task once, before dispatching the tasks.
+    task_indices = [index for index in data_indices if index is not None]
+
     # Execute module data parsing tasks in parallel
     if workers == 1 or len(parse_tasks) == 1:
         # Sequential execution
-        for i, task in enumerate(parse_tasks):
-            idx = [d for d in data_indices if d is not None][i]
+        for task, idx in zip(parse_tasks, task_indices, strict=True):
             task["func"](extracted_module_data=log_data_tuple[idx], output_file=task["output"], **task["kwargs"])
     else:
         # Parallel execution
         n_workers = workers if workers > 0 else None  # None uses all available cores
         with ProcessPoolExecutor(max_workers=n_workers) as executor:
             futures = []
-            for i, task in enumerate(parse_tasks):
-                idx = [d for d in data_indices if d is not None][i]
+            for task, idx in zip(parse_tasks, task_indices, strict=True):
                 future = executor.submit(
                     _parse_module_data, task["func"], log_data_tuple[idx], task["output"], **task["kwargs"]
                 )
@@ -992,7 +1009,7 @@ def _extract_mesoscope_vr_encoder_data(
         data_indices.append(None)
 
     # Aborts early if no module data needs to be parsed.
-    if set(data_indices) == {None}:
+    if not parse_tasks:
         return
 
     # Extracts module data in parallel
@@ -1000,18 +1017,19 @@ def _extract_mesoscope_vr_encoder_data(
         log_path=log_path, module_type_id=tuple(module_type_id), n_workers=workers
     )
 
+    # Resolves the extracted data index for each parsing task once, before dispatching the tasks.
+    task_indices = [index for index in data_indices if index is not None]
+
     # Parses extracted module data in parallel
     if workers == 1 or len(parse_tasks) == 1:
         # Sequential execution
-        for i, task in enumerate(parse_tasks):
-            idx = [d for d in data_indices if d is not None][i]
+        for task, idx in zip(parse_tasks, task_indices, strict=True):
             task["func"](extracted_module_data=log_data_tuple[idx], output_file=task["output"], **task["kwargs"])
     else:
         n_workers = workers if workers > 0 else None
         with ProcessPoolExecutor(max_workers=n_workers) as executor:
             futures = []
-            for i, task in enumerate(parse_tasks):
-                idx = [d for d in data_indices if d is not None][i]
+            for task, idx in zip(parse_tasks, task_indices, strict=True):
                 future = executor.submit(
                     _parse_module_data, task["func"], log_data_tuple[idx], task["output"], **task["kwargs"]
                 )
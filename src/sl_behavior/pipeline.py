@@ -3,8 +3,13 @@
 Supports both local and remote processing modes.
 """
 
+import os
 from enum import StrEnum
 from pathlib import Path  # noqa: TC003
+from functools import lru_cache
+from collections import deque
+from collections.abc import Callable  # noqa: TC003
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 
 from sl_shared_assets import SessionData, SessionTypes, ProcessingTracker, ProcessingTrackers
 from ataraxis_base_utilities import LogLevel, console
@@ -40,6 +45,41 @@ class BehaviorJobNames(StrEnum):
     """The name for the Encoder microcontroller data processing job."""
 
 
+# Maps each base job name to the function that carries out the job. Each function accepts the path to the session's
+# data directory and the number of worker processes to use for parallel processing.
+_JOB_PROCESSORS: dict[str, Callable[[Path, int], None]] = {
+    BehaviorJobNames.RUNTIME: lambda session_path, _: process_runtime_data(session_path=session_path),
+    BehaviorJobNames.FACE_CAMERA: lambda session_path, workers: process_camera_timestamps(
+        session_path=session_path, log_id=CameraLogIds.FACE, workers=workers
+    ),
+    BehaviorJobNames.BODY_CAMERA: lambda session_path, workers: process_camera_timestamps(
+        session_path=session_path, log_id=CameraLogIds.BODY, workers=workers
+    ),
+    BehaviorJobNames.ACTOR_MICROCONTROLLER: lambda session_path, workers: process_microcontroller_data(
+        session_path=session_path, log_id=MicrocontrollerLogIds.ACTOR, workers=workers
+    ),
+    BehaviorJobNames.SENSOR_MICROCONTROLLER: lambda session_path, workers: process_microcontroller_data(
+        session_path=session_path, log_id=MicrocontrollerLogIds.SENSOR, workers=workers
+    ),
+    BehaviorJobNames.ENCODER_MICROCONTROLLER: lambda session_path, workers: process_microcontroller_data(
+        session_path=session_path, log_id=MicrocontrollerLogIds.ENCODER, workers=workers
+    ),
+}
+
+# Maximum number of generated job IDs cached by each process.
+_MAXIMUM_CACHED_JOB_IDS: int = 256
+
+# Maps each base job name to the name of the log file that stores the job's input data.
+_JOB_LOG_FILES: dict[str, str] = {
+    BehaviorJobNames.RUNTIME: "1_log.npz",
+    BehaviorJobNames.FACE_CAMERA: f"{CameraLogIds.FACE}_log.npz",
+    BehaviorJobNames.BODY_CAMERA: f"{CameraLogIds.BODY}_log.npz",
+    BehaviorJobNames.ACTOR_MICROCONTROLLER: f"{MicrocontrollerLogIds.ACTOR}_log.npz",
+    BehaviorJobNames.SENSOR_MICROCONTROLLER: f"{MicrocontrollerLogIds.SENSOR}_log.npz",
+    BehaviorJobNames.ENCODER_MICROCONTROLLER: f"{MicrocontrollerLogIds.ENCODER}_log.npz",
+}
+
+
 def get_session_root(session: SessionData) -> Path:
     """Returns the canonical session root path for consistent job ID generation.
 
@@ -55,38 +95,70 @@ def get_session_root(session: SessionData) -> Path:
     return session.raw_data.raw_data_path.parent
 
 
-def _resolve_available_jobs(session_path: Path) -> dict[str, bool]:
+def _resolve_available_jobs(session_path: Path, session: SessionData | None = None) -> dict[str, bool]:
     """Detects which processing jobs can run on the session's data based on existing log files.
 
     Args:
         session_path: The path to the session's data directory.
+        session: The SessionData instance for the target session, if it is already loaded. If not provided, the session
+            data is loaded from the session_path.
 
     Returns:
         A dictionary mapping job names to boolean values indicating whether the corresponding log file exists.
     """
-    session = SessionData.load(session_path=session_path)
+    if session is None:
+        session = SessionData.load(session_path=session_path)
     behavior_data_path = session.raw_data.behavior_data_path
 
-    # Checks for each log file and determines which jobs are available.
-    available_jobs: dict[str, bool] = {
-        BehaviorJobNames.RUNTIME: behavior_data_path.joinpath("1_log.npz").exists(),
-        BehaviorJobNames.FACE_CAMERA: behavior_data_path.joinpath(f"{CameraLogIds.FACE}_log.npz").exists(),
-        BehaviorJobNames.BODY_CAMERA: behavior_data_path.joinpath(f"{CameraLogIds.BODY}_log.npz").exists(),
-        BehaviorJobNames.ACTOR_MICROCONTROLLER: behavior_data_path.joinpath(
-            f"{MicrocontrollerLogIds.ACTOR}_log.npz"
-        ).exists(),
-        BehaviorJobNames.SENSOR_MICROCONTROLLER: behavior_data_path.joinpath(
-            f"{MicrocontrollerLogIds.SENSOR}_log.npz"
-        ).exists(),
-        BehaviorJobNames.ENCODER_MICROCONTROLLER: behavior_data_path.joinpath(
-            f"{MicrocontrollerLogIds.ENCODER}_log.npz"
-        ).exists(),
-    }
+    # Lists the behavior data directory once and checks for each log file in memory, instead of querying the filesystem
+    # separately for every log file.
+    try:
+        with os.scandir(behavior_data_path) as entries:
+            log_files = {entry.name for entry in entries if entry.name.endswith("_log.npz")}
+    except OSError:
+        log_files = set()
+
+    # Determines which jobs are available based on the presence of their log files.
+    return {base_job_name: log_file in log_files for base_job_name, log_file in _JOB_LOG_FILES.items()}
+
+
+@lru_cache(maxsize=_MAXIMUM_CACHED_JOB_IDS)
+def _generate_job_id(session_root: Path, job_name: str) -> str:
+    """Generates the unique processing job identifier for the specified job.
+
+    Job identifiers are deterministic, so each identifier is only generated once per process and reused by all later
+    calls.
+
+    Args:
+        session_root: The canonical root path of the processed session (parent of raw_data).
+        job_name: The full name of the job, which prefixes the base job name with the session name.
+
+    Returns:
+        The unique hexadecimal identifier of the job.
+    """
+    return ProcessingTracker.generate_job_id(session_path=session_root, job_name=job_name)
 
-    return available_jobs
 
+def _generate_job_names(session_name: str, base_job_names: list[str]) -> dict[str, str]:
+    """Generates the full names of the specified jobs.
+
+    Full job names prefix the base job names with the session name. Each full name is built once, so that all code
+    that processes the session's jobs can look the full names up instead of rebuilding them.
+
+    Args:
+        session_name: The unique identifier of the session whose jobs to name.
+        base_job_names: The list of base job names (from BehaviorJobNames) for which to generate the full names.
 
-def _generate_job_ids(session: SessionData, base_job_names: list[str]) -> dict[str, str]:
+    Returns:
+        A dictionary mapping base job names to their full job names (with session prefix).
+    """
+    job_name_prefix = f"{session_name}_"
+    return {base_job_name: job_name_prefix + base_job_name for base_job_name in base_job_names}
+
+
+def _generate_job_ids(
+    session: SessionData, base_job_names: list[str], job_names: dict[str, str] | None = None
+) -> dict[str, str]:
     """Generates unique processing job identifiers for the specified jobs.
 
     Uses the canonical session root path (parent of raw_data) to ensure consistent job IDs across local and remote
@@ -95,22 +167,29 @@ def _generate_job_ids(session: SessionData, base_job_names: list[str]) -> dict[s
     Args:
         session: The loaded SessionData instance for the target session.
         base_job_names: The list of base job names (from BehaviorJobNames) for which to generate the IDs.
+        job_names: The mapping of base job names to full job names returned by _generate_job_names(), if the caller
+            already generated it. If not provided, the full job names are generated by this function.
 
     Returns:
         A dictionary mapping full job names (with session prefix) to their generated job IDs.
     """
+    if job_names is None:
+        job_names = _generate_job_names(session_name=session.session_name, base_job_names=base_job_names)
+
     session_root = get_session_root(session)
-    session_name = session.session_name
-    job_ids: dict[str, str] = {}
-    for base_job_name in base_job_names:
-        full_job_name = f"{session_name}_{base_job_name}"
-        job_ids[full_job_name] = ProcessingTracker.generate_job_id(session_path=session_root, job_name=full_job_name)
-    return job_ids
+    full_job_names = [job_names[base_job_name] for base_job_name in base_job_names]
+    return {
+        full_job_name: _generate_job_id(session_root=session_root, job_name=full_job_name)
+        for full_job_name in full_job_names
+    }
 
 
 def _initialize_processing_tracker(
     session_path: Path,
     base_job_names: list[str],
+    session: SessionData | None = None,
+    tracker: ProcessingTracker | None = None,
+    job_names: dict[str, str] | None = None,
 ) -> dict[str, str]:
     """Initializes the processing tracker file using the requested job IDs.
 
@@ -121,19 +200,27 @@ def _initialize_processing_tracker(
     Args:
         session_path: The path to the session's data directory.
         base_job_names: The base job names (from BehaviorJobNames) for the processing jobs to track.
+        session: The SessionData instance for the target session, if it is already loaded. If not provided, the session
+            data is loaded from the session_path.
+        tracker: The ProcessingTracker instance for the session's behavior processing tracker file. If not provided,
+            a new instance is created for the session's tracker file.
+        job_names: The mapping of base job names to full job names returned by _generate_job_names(), if the caller
+            already generated it. If not provided, the full job names are generated by this function.
 
     Returns:
         A dictionary mapping full job names (with session prefix) to their generated job IDs.
     """
-    session = SessionData.load(session_path=session_path)
+    if session is None:
+        session = SessionData.load(session_path=session_path)
 
-    # Initializes the processing tracker for this pipeline.
-    tracker = ProcessingTracker(
-        file_path=session.tracking_data.tracking_data_path.joinpath(ProcessingTrackers.BEHAVIOR)
-    )
+    # Initializes the processing tracker for this pipeline, unless the caller already created it.
+    if tracker is None:
+        tracker = ProcessingTracker(
+            file_path=session.tracking_data.tracking_data_path.joinpath(ProcessingTrackers.BEHAVIOR)
+        )
 
     # Generates job IDs for each requested job using the canonical session root path.
-    job_ids = _generate_job_ids(session=session, base_job_names=base_job_names)
+    job_ids = _generate_job_ids(session=session, base_job_names=base_job_names, job_names=job_names)
 
     # Initializes all jobs in the tracker file.
     tracker.initialize_jobs(job_ids=list(job_ids.values()))
@@ -152,7 +239,9 @@ def _execute_job(
 
     Args:
         session_path: The path to the session's data directory.
-        job_name: The name of the job to run.
+        job_name: The name of the job to run. Internal callers pass the base job name (from BehaviorJobNames). The
+            full job names that prefix the base job name with the session name are also accepted for compatibility
+            with external callers.
         job_id: The unique hexadecimal identifier for this processing job.
         workers: The number of worker processes to use for parallel processing.
         tracker: The ProcessingTracker instance used to track the pipeline's runtime status.
@@ -164,34 +253,22 @@ def _execute_job(
     tracker.start_job(job_id=job_id)
 
     try:
-        if job_name.endswith(BehaviorJobNames.RUNTIME):
-            process_runtime_data(session_path=session_path)
-
-        elif job_name.endswith(BehaviorJobNames.FACE_CAMERA):
-            process_camera_timestamps(session_path=session_path, log_id=CameraLogIds.FACE, workers=workers)
-
-        elif job_name.endswith(BehaviorJobNames.BODY_CAMERA):
-            process_camera_timestamps(session_path=session_path, log_id=CameraLogIds.BODY, workers=workers)
-
-        elif job_name.endswith(BehaviorJobNames.ACTOR_MICROCONTROLLER):
-            process_microcontroller_data(session_path=session_path, log_id=MicrocontrollerLogIds.ACTOR, workers=workers)
-
-        elif job_name.endswith(BehaviorJobNames.SENSOR_MICROCONTROLLER):
-            process_microcontroller_data(
-                session_path=session_path, log_id=MicrocontrollerLogIds.SENSOR, workers=workers
+        # Resolves the job's processor directly for base job names. Only falls back to matching the job name's suffix
+        # for full job names passed by external callers.
+        processor = _JOB_PROCESSORS.get(job_name)
+        if processor is None:
+            processor = next(
+                (function for base_job_name, function in _JOB_PROCESSORS.items() if job_name.endswith(base_job_name)),
+                None,
             )
-
-        elif job_name.endswith(BehaviorJobNames.ENCODER_MICROCONTROLLER):
-            process_microcontroller_data(
-                session_path=session_path, log_id=MicrocontrollerLogIds.ENCODER, workers=workers
-            )
-
-        else:
+        if processor is None:
             message = (
                 f"Unable to execute the requested job {job_name} with ID '{job_id}'. The input job name is not "
                 f"recognized. Use one of the valid Job names: {list(BehaviorJobNames)}."
             )
             console.error(message=message, error=ValueError)
+        else:
+            processor(session_path, workers)
 
         tracker.complete_job(job_id=job_id)
 
@@ -200,6 +277,108 @@ def _execute_job(
         raise
 
 
+def _execute_job_in_process(session_path: Path, base_job_name: str, workers: int) -> None:
+    """Carries out the data processing of a single behavior data processing pipeline job in a worker process.
+
+    Notes:
+        This function does not update the processing tracker. The tracker is updated by the process that submits the
+        job, so that only one process writes to the tracker file.
+
+    Args:
+        session_path: The path to the session's data directory.
+        base_job_name: The base name of the job to run (from BehaviorJobNames).
+        workers: The number of worker processes to use for parallel processing.
+    """
+    _JOB_PROCESSORS[base_job_name](session_path, workers)
+
+
+def _get_available_cores() -> int | None:
+    """Returns the number of CPU cores the current process is allowed to use.
+
+    Unlike os.cpu_count(), respects the CPU affinity mask of the process, which reflects taskset, container (cgroup
+    cpuset), and cluster scheduler CPU allocations on Linux. Falls back to the total number of CPU cores on platforms
+    that do not support CPU affinity queries.
+
+    Returns:
+        The number of CPU cores available to the process, or None if the number cannot be determined.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()
+
+
+def _execute_jobs_in_parallel(
+    session_path: Path,
+    job_ids: dict[str, str],
+    workers: int,
+    tracker: ProcessingTracker,
+) -> None:
+    """Executes multiple processing jobs of the behavior data processing pipeline in parallel.
+
+    Since all jobs process different log files, they are independent of each other and can run at the same time. The
+    available CPU cores are split evenly between the jobs that use worker processes to avoid oversubscribing the cores.
+    The runtime data processing job does not use worker processes and is, therefore, excluded from the split.
+
+    Notes:
+        All tracker updates are carried out by the calling process, and the worker processes only carry out the data
+        processing. Each job is marked as running only when it is dispatched to a worker process. If any job fails, no
+        further jobs are dispatched, and the jobs that were not dispatched are marked as failed. The jobs that are
+        already running are allowed to finish before the first encountered error is re-raised.
+
+    Args:
+        session_path: The path to the session's data directory.
+        job_ids: A dictionary mapping the base names of the jobs to run to their job IDs.
+        workers: The total number of worker processes to use for parallel processing. Setting this to a value less
+            than 1 uses all CPU cores available to the process.
+        tracker: The ProcessingTracker instance used to track the pipeline's runtime status.
+
+    Raises:
+        Exception: The first exception raised by any of the jobs, once all running jobs finish.
+    """
+    available_cores = workers if workers > 0 else (_get_available_cores() or 1)
+    worker_job_count = sum(1 for base_job_name in job_ids if base_job_name != BehaviorJobNames.RUNTIME)
+    job_workers = max(1, available_cores // max(1, worker_job_count))
+    maximum_running_jobs = min(len(job_ids), available_cores)
+
+    queued_jobs = deque(job_ids.items())
+    running_jobs: dict[Future[None], str] = {}
+    first_error: BaseException | None = None
+    with ProcessPoolExecutor(max_workers=maximum_running_jobs) as executor:
+        while queued_jobs or running_jobs:
+            # Dispatches queued jobs to the free worker processes, unless a job has already failed.
+            while queued_jobs and len(running_jobs) < maximum_running_jobs and first_error is None:
+                base_job_name, job_id = queued_jobs.popleft()
+                console.echo(message=f"Running '{base_job_name}' job with ID {job_id}...")
+                tracker.start_job(job_id=job_id)
+                future = executor.submit(
+                    _execute_job_in_process, session_path=session_path, base_job_name=base_job_name, workers=job_workers
+                )
+                running_jobs[future] = job_id
+
+            if not running_jobs:
+                break
+
+            # Records the outcome of each job as it finishes.
+            finished_jobs, _ = wait(running_jobs, return_when=FIRST_COMPLETED)
+            for future in finished_jobs:
+                job_id = running_jobs.pop(future)
+                error = future.exception()
+                if error is None:
+                    tracker.complete_job(job_id=job_id)
+                    continue
+
+                tracker.fail_job(job_id=job_id)
+                if first_error is None:
+                    first_error = error
+
+    # Marks the jobs that were not dispatched due to an earlier job failure as failed.
+    for _, job_id in queued_jobs:
+        tracker.fail_job(job_id=job_id)
+
+    if first_error is not None:
+        raise first_error
+
+
 def process_session(
     session_path: Path,
     job_id: str | None = None,
@@ -217,7 +396,7 @@ def process_session(
     Args:
         session_path: The path to the session's data directory.
         job_id: The unique hexadecimal identifier for the processing job to execute. If provided, only the job
-            matching this ID is executed. If not provided, all requested jobs are run sequentially with automatic
+            matching this ID is executed. If not provided, all requested jobs are run in parallel with automatic
             tracker management. Typically, this mode of job definition is used when running the processing on the
             remote compute server via the bindings in the sl-forgery library.
         process_runtime: Determines whether to process the session runtime data.
@@ -227,7 +406,8 @@ def process_session(
         process_sensor_microcontroller: Determines whether to process the Sensor microcontroller data.
         process_encoder_microcontroller: Determines whether to process the Encoder microcontroller data.
         workers: The number of worker processes to use for parallel processing. Setting this to a value less than 1
-            uses all available CPU cores. Setting this to 1 conducts processing sequentially.
+            uses all available CPU cores. Setting this to 1 conducts processing sequentially. When running multiple
+            jobs without a job_id, the worker processes are split evenly between the jobs.
     """
     # Loads the session data and validates the session type.
     session = SessionData.load(session_path=session_path)
@@ -248,60 +428,89 @@ def process_session(
 
     # Determines the execution mode and resolves job IDs accordingly.
     if job_id is not None:
-        # REMOTE mode: Finds the job name matching the provided job_id.
-        all_job_ids = _generate_job_ids(session=session, base_job_names=list(BehaviorJobNames))
-        id_to_name: dict[str, str] = {v: k for k, v in all_job_ids.items()}
+        # REMOTE mode: Finds the base job name matching the provided job_id. Generates the IDs of the supported jobs
+        # one at a time and stops at the first match, instead of generating the IDs of all jobs upfront.
+        session_root = get_session_root(session)
+        job_names = _generate_job_names(session_name=session_name, base_job_names=list(BehaviorJobNames))
+        base_job_name = next(
+            (
+                base_name
+                for base_name, full_name in job_names.items()
+                if _generate_job_id(session_root=session_root, job_name=full_name) == job_id
+            ),
+            None,
+        )
 
-        if job_id not in id_to_name:
+        if base_job_name is None:
             tracker.fail_job(job_id=job_id)
+            all_job_ids = _generate_job_ids(session=session, base_job_names=list(BehaviorJobNames), job_names=job_names)
             message = (
                 f"Unable to execute the requested job with ID '{job_id}'. The input identifier does not match any "
                 f"jobs available for this session. Use one of the valid job IDs: {list(all_job_ids.values())}."
             )
             console.error(message=message, error=ValueError)
-
-        # Runs the job whose id matches the target job_id.
-        job_name = id_to_name[job_id]
-        _execute_job(session_path=session_path, job_name=job_name, job_id=job_id, workers=workers, tracker=tracker)
+        else:
+            # Runs the job whose id matches the target job_id.
+            _execute_job(
+                session_path=session_path,
+                job_name=base_job_name,
+                job_id=job_id,
+                workers=workers,
+                tracker=tracker,
+            )
     else:
         # LOCAL mode: Generates job IDs, creates a local tracker file, and runs the requested jobs.
 
         # Resolves which jobs are available based on existing log files.
-        available_jobs = _resolve_available_jobs(session_path=session_path)
-
-        # Maps base job names to their requested flags.
-        requested_jobs: dict[str, bool] = {
-            BehaviorJobNames.RUNTIME: process_runtime,
-            BehaviorJobNames.FACE_CAMERA: process_face_camera,
-            BehaviorJobNames.BODY_CAMERA: process_body_camera,
-            BehaviorJobNames.ACTOR_MICROCONTROLLER: process_actor_microcontroller,
-            BehaviorJobNames.SENSOR_MICROCONTROLLER: process_sensor_microcontroller,
-            BehaviorJobNames.ENCODER_MICROCONTROLLER: process_encoder_microcontroller,
-        }
-
-        # If all requested job flags are False, treats them as all True (process all available jobs).
-        if not any(requested_jobs.values()):
-            requested_jobs = dict.fromkeys(requested_jobs, True)
+        available_jobs = _resolve_available_jobs(session_path=session_path, session=session)
+
+        # Collects the requested job flags in the order of the BehaviorJobNames members they correspond to. If all
+        # flags are False, treats them as all True (process all available jobs).
+        requested_flags = (
+            process_runtime,
+            process_face_camera,
+            process_body_camera,
+            process_actor_microcontroller,
+            process_sensor_microcontroller,
+            process_encoder_microcontroller,
+        )
+        process_all = not any(requested_flags)
 
         # Determines which base jobs to run (requested AND available).
         base_jobs_to_run = [
             base_job_name
-            for base_job_name, requested in requested_jobs.items()
-            if requested and available_jobs[base_job_name]
+            for base_job_name, requested in zip(BehaviorJobNames, requested_flags, strict=True)
+            if (requested or process_all) and available_jobs[base_job_name]
         ]
 
-        # Initializes the tracker and runs all requested jobs sequentially.
+        # Initializes the tracker and runs all requested jobs.
         console.echo(message=f"Initializing processing tracker for {len(base_jobs_to_run)} job(s)...")
-        job_ids = _initialize_processing_tracker(session_path=session_path, base_job_names=base_jobs_to_run)
+        job_names = _generate_job_names(session_name=session_name, base_job_names=base_jobs_to_run)
+        job_ids = _initialize_processing_tracker(
+            session_path=session_path,
+            base_job_names=base_jobs_to_run,
+            session=session,
+            tracker=tracker,
+            job_names=job_names,
+        )
 
-        for base_job_name in base_jobs_to_run:
-            full_job_name = f"{session_name}_{base_job_name}"
-            _execute_job(
+        # Runs the jobs sequentially if there is only one job or if processing is restricted to a single core.
+        # Otherwise, runs all jobs in parallel.
+        if len(base_jobs_to_run) > 1 and workers != 1:
+            _execute_jobs_in_parallel(
                 session_path=session_path,
-                job_name=full_job_name,
-                job_id=job_ids[full_job_name],
+                job_ids={base_job_name: job_ids[job_names[base_job_name]] for base_job_name in base_jobs_to_run},
                 workers=workers,
                 tracker=tracker,
             )
+        else:
+            for base_job_name in base_jobs_to_run:
+                _execute_job(
+                    session_path=session_path,
+                    job_name=base_job_name,
+                    job_id=job_ids[job_names[base_job_name]],
+                    workers=workers,
+                    tracker=tracker,
+                )
 
     console.echo(message="All processing jobs completed successfully.", level=LogLevel.SUCCESS)
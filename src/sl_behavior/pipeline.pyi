@@ -1,5 +1,6 @@
 from enum import StrEnum
 from pathlib import Path
+from collections.abc import Callable
 
 from sl_shared_assets import SessionData, SessionTypes, ProcessingTracker
 
@@ -23,11 +24,30 @@ class BehaviorJobNames(StrEnum):
     SENSOR_MICROCONTROLLER = "sensor_microcontroller_processing"
     ENCODER_MICROCONTROLLER = "encoder_microcontroller_processing"
 
+_JOB_PROCESSORS: dict[str, Callable[[Path, int], None]]
+_MAXIMUM_CACHED_JOB_IDS: int
+_JOB_LOG_FILES: dict[str, str]
+
 def get_session_root(session: SessionData) -> Path: ...
-def _resolve_available_jobs(session_path: Path) -> dict[str, bool]: ...
-def _generate_job_ids(session: SessionData, base_job_names: list[str]) -> dict[str, str]: ...
-def _initialize_processing_tracker(session_path: Path, base_job_names: list[str]) -> dict[str, str]: ...
+def _resolve_available_jobs(session_path: Path, session: SessionData | None = None) -> dict[str, bool]: ...
+def _generate_job_id(session_root: Path, job_name: str) -> str: ...
+def _generate_job_names(session_name: str, base_job_names: list[str]) -> dict[str, str]: ...
+def _generate_job_ids(
+    session: SessionData, base_job_names: list[str], job_names: dict[str, str] | None = None
+) -> dict[str, str]: ...
+def _initialize_processing_tracker(
+    session_path: Path,
+    base_job_names: list[str],
+    session: SessionData | None = None,
+    tracker: ProcessingTracker | None = None,
+    job_names: dict[str, str] | None = None,
+) -> dict[str, str]: ...
 def _execute_job(session_path: Path, job_name: str, job_id: str, workers: int, tracker: ProcessingTracker) -> None: ...
+def _execute_job_in_process(session_path: Path, base_job_name: str, workers: int) -> None: ...
+def _get_available_cores() -> int | None: ...
+def _execute_jobs_in_parallel(
+    session_path: Path, job_ids: dict[str, str], workers: int, tracker: ProcessingTracker
+) -> None: ...
 def process_session(
     session_path: Path,
     job_id: str | None = None,
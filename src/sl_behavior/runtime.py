@@ -2,8 +2,13 @@
 acquisition systems used in the Sun lab.
 """
 
-from typing import TYPE_CHECKING
+import ast
+import mmap
+import zlib
+import struct
 from pathlib import Path  # noqa: TC003
+import zipfile
+from collections.abc import Iterator  # noqa: TC003
 
 from numba import njit  # type: ignore[import-untyped]
 import numpy as np
@@ -18,9 +23,6 @@ from sl_shared_assets import (
 )
 from ataraxis_base_utilities import LogLevel, console
 
-if TYPE_CHECKING:
-    from numpy.lib.npyio import NpzFile
-
 # Message codes used by the Mesoscope-VR data acquisition system to identify the type of logged data.
 _CUE_SEQUENCE_MIN_LENGTH: int = 500
 """The minimum length, in bytes, of a valid VR wall cue sequence message."""
@@ -35,6 +37,14 @@ _AVERSIVE_GUIDANCE_STATE_CODE: int = 4
 _DISTANCE_SNAPSHOT_CODE: int = 5
 """The code for the distance snapshot data logged when VR wall cue sequence changes."""
 
+# Binary layout constants used to decode the messages stored in .npz log archives.
+_ZIP_LOCAL_HEADER_SIGNATURE: bytes = b"PK\x03\x04"
+"""The signature that marks the start of each local file header in a .zip (.npz) archive."""
+_ZIP_LOCAL_HEADER_SIZE: int = 30
+"""The size, in bytes, of the fixed-length portion of each local file header in a .zip (.npz) archive."""
+_NPY_MAGIC: bytes = b"\x93NUMPY"
+"""The magic string that marks the start of each .npy file."""
+
 
 def _prepare_motif_data(
     trial_motifs: list[NDArray[np.uint8]], trial_distances: list[float]
@@ -467,6 +477,89 @@ def _process_trial_sequence(
     return cues, distances, trigger_zone_starts, trigger_zone_ends, trial_start_distances
 
 
+def _iterate_log_messages(log_path: Path) -> Iterator[NDArray[np.uint8]]:
+    """Iterates over the messages stored in the target .npz log archive in the order they were logged.
+
+    Notes:
+        Memory-maps the archive and decodes each stored .npy file directly from the mapped file. This bypasses the
+        per-message file objects and CRC-32 checks used by np.load(), whose overhead dominates the time required to read
+        the many small messages stored in each log archive. Only the data of the currently processed message is copied
+        out of the mapped file, so the archive is never loaded into memory as a whole. Messages stored in an unexpected
+        format are read using numpy's .npy parser instead.
+
+        The member data offset is resolved from the local file header, so ZIP64 extra fields written into the local
+        header are skipped correctly. The data size is taken from the central directory, so members whose sizes are
+        only stored in trailing data descriptors are also supported. Unlike np.load(), this function does not verify
+        the CRC-32 checksum of the decoded messages.
+
+    Args:
+        log_path: The path to the .npz archive whose messages to iterate over.
+
+    Yields:
+        The byte-serialized data of each logged message, stored as a one-dimensional uint8 array.
+    """
+    # Caches whether each unique .npy header describes a one-dimensional uint8 array. Since all messages of the same
+    # type have the same size, each archive typically contains only a few unique headers.
+    header_cache: dict[bytes, bool] = {}
+
+    with (
+        log_path.open("rb") as log_file,
+        mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+        zipfile.ZipFile(log_file) as archive,
+    ):
+        for member in archive.infolist():
+            # Locates the member's data using its local file header and decompresses it, if necessary. Slicing the
+            # mapped file copies the sliced data, so the yielded messages do not reference the mapped file. Encrypted
+            # members and members that use other compression methods are handled by the fallback below.
+            offset = member.header_offset
+            message_data: bytes | None = None
+            if buffer[offset : offset + 4] == _ZIP_LOCAL_HEADER_SIGNATURE and not member.flag_bits & 0x1:
+                name_length, extra_length = struct.unpack_from("<HH", buffer, offset + 26)
+                data_start = offset + _ZIP_LOCAL_HEADER_SIZE + name_length + extra_length
+                member_data = buffer[data_start : data_start + member.compress_size]
+                if member.compress_type == zipfile.ZIP_STORED:
+                    message_data = member_data
+                elif member.compress_type == zipfile.ZIP_DEFLATED:
+                    message_data = zlib.decompress(member_data, wbits=-zlib.MAX_WBITS)
+
+            # Parses the .npy header. Version 1 headers store the header length as a 2-byte value, while later versions
+            # use 4 bytes.
+            if message_data is not None and message_data[:6] == _NPY_MAGIC:
+                length_size = 2 if message_data[6] == 1 else 4
+                array_start = 8 + length_size + int.from_bytes(message_data[8 : 8 + length_size], "little")
+                header = message_data[8 + length_size : array_start]
+
+                is_uint8_vector = header_cache.get(header)
+                if is_uint8_vector is None:
+                    header_fields = ast.literal_eval(header.decode("latin1"))
+                    is_uint8_vector = header_fields["descr"] == "|u1" and len(header_fields["shape"]) == 1
+                    header_cache[header] = is_uint8_vector
+
+                if is_uint8_vector:
+                    yield np.frombuffer(message_data, dtype=np.uint8, offset=array_start)
+                    continue
+
+            # Falls back to numpy's parser for any message that cannot be decoded directly.
+            with archive.open(member) as member_file:
+                yield np.lib.format.read_array(member_file)
+
+
+def _convert_to_utc_timestamps(elapsed_timestamps: list[int], onset_us: np.uint64) -> NDArray[np.uint64] | list[int]:
+    """Converts the input elapsed timestamps into absolute UTC timestamps.
+
+    Args:
+        elapsed_timestamps: The timestamps to convert, stored as microseconds elapsed since the logging onset.
+        onset_us: The logging onset timestamp, stored as microseconds since epoch onset.
+
+    Returns:
+        The converted timestamps, stored as microseconds since epoch onset. If there are no timestamps to convert,
+        returns the input empty list to preserve the schema of the exported dataframes.
+    """
+    if not elapsed_timestamps:
+        return elapsed_timestamps
+    return np.array(elapsed_timestamps, dtype=np.uint64) + onset_us
+
+
 def _extract_mesoscope_vr_data(
     log_path: Path, output_directory: Path, experiment_configuration: MesoscopeExperimentConfiguration | None = None
 ) -> None:
@@ -482,30 +575,27 @@ def _extract_mesoscope_vr_data(
         experiment_configuration: The MesoscopeExperimentConfiguration instance for the processed session. Only
             required if the processed session is an experiment session.
     """
-    # Loads the archive into RAM
-    archive: NpzFile = np.load(file=log_path)
+    # Prepares to iterate over the logged messages. The archive is decoded one message at a time while iterating.
+    messages: Iterator[NDArray[np.uint8]] = _iterate_log_messages(log_path=log_path)
 
     # Pre-creates the variables used to store extracted data
     system_states = []
-    system_timestamps = []
+    system_timestamps: list[int] = []
     runtime_states = []
-    runtime_timestamps = []
+    runtime_timestamps: list[int] = []
     reinforcing_guidance_states = []
-    reinforcing_guidance_timestamps = []
+    reinforcing_guidance_timestamps: list[int] = []
     aversive_guidance_states = []
-    aversive_guidance_timestamps = []
+    aversive_guidance_timestamps: list[int] = []
     cue_sequences: list[NDArray[np.uint8]] = []
     distance_snapshots: list[np.float64] = []
 
     # Locates the logging onset timestamp. The onset is used to convert the timestamps for logged data into absolute
     # UTC timestamps. Originally, all timestamps other than onset are stored as elapsed time in microseconds
     # relative to the onset timestamp.
-    timestamp_offset = 0
     onset_us = np.uint64(0)
-    timestamp: np.uint64
-    for number, item in enumerate(archive.files):
-        message: NDArray[np.uint8] = archive[item]  # Extracts message payload from the compressed .npy file
-
+    pre_onset_messages: list[NDArray[np.uint8]] = []
+    for message in messages:
         # Recovers the uint64 timestamp value from each message. The timestamp occupies 8 bytes of each logged
         # message starting at index 1. If the timestamp value is 0, the message contains the onset timestamp value
         # stored as an 8-byte payload. Index 0 stores the source ID (uint8 value)
@@ -513,22 +603,27 @@ def _extract_mesoscope_vr_data(
             # Extracts the byte-serialized UTC timestamp stored as microseconds since epoch onset.
             onset_us = np.uint64(message[9:].view("<i8")[0].copy())
 
-            # Breaks the loop once the onset is found. Generally, the onset is expected to be found very early into
-            # the loop
-            timestamp_offset = number  # Records the item number at which the onset value was found.
+            # Discards the messages logged before the onset and breaks the loop once the onset is found. Generally, the
+            # onset is expected to be found very early into the loop
+            pre_onset_messages.clear()
             break
 
-    # Once the onset has been discovered, loops over all remaining messages and extracts data stored in these
-    # messages.
-    for item in archive.files[timestamp_offset + 1 :]:
-        message = archive[item]
+        # Buffers the messages that precede the onset, as they are needed if the log does not contain the onset.
+        pre_onset_messages.append(message)
+    else:
+        # If the log does not contain the onset, processes all messages other than the first one.
+        messages = iter(pre_onset_messages[1:])
 
-        # Extracts the elapsed microseconds since timestamp and uses it to calculate the global timestamp for the
-        # message, in microseconds since epoch onset.
-        elapsed_microseconds = np.uint64(message[1:9].view(np.uint64)[0].copy())
-        timestamp = onset_us + elapsed_microseconds
+    # Once the onset has been discovered, loops over all remaining messages and extracts data stored in these
+    # messages. Since the message iterator is shared by both loops, this loop resumes after the onset message.
+    for message in messages:
+        # Extracts the elapsed microseconds since onset as a plain integer. The onset is added to all timestamps of
+        # each data stream in a single vectorized operation once the loop finishes, which avoids constructing and
+        # adding numpy scalars for every processed message.
+        timestamp = int(message[1:9].view(np.uint64)[0])
 
         payload = message[9:]  # Extracts the payload from the message
+        message_code = int(payload[0])  # Resolves the message type code once for all checks below
 
         # If the message is longer than _CUE_SEQUENCE_MIN_LENGTH bytes, it is a sequence of wall cues.
         if len(payload) > _CUE_SEQUENCE_MIN_LENGTH and experiment_configuration is not None:
@@ -537,32 +632,32 @@ def _extract_mesoscope_vr_data(
             cue_sequences.append(payload.view(np.uint8).copy())  # Keeps the original numpy uint8 format
 
         # If the first element is _SYSTEM_STATE_CODE, the message communicates the VR state code.
-        elif payload[0] == _SYSTEM_STATE_CODE:
+        elif message_code == _SYSTEM_STATE_CODE:
             # Extracts the VR state code from the second byte of the message.
             system_states.append(np.uint8(payload[1]))
             system_timestamps.append(timestamp)
 
         # If the starting code is _RUNTIME_STATE_CODE, the message communicates the session runtime state code.
-        elif payload[0] == _RUNTIME_STATE_CODE:
+        elif message_code == _RUNTIME_STATE_CODE:
             # Extracts the runtime state code from the second byte of the message.
             runtime_states.append(np.uint8(payload[1]))
             runtime_timestamps.append(timestamp)
 
         # If the starting code is _REINFORCING_GUIDANCE_STATE_CODE, the message communicates the current reinforcing
         # (water reward) trial guidance state.
-        elif payload[0] == _REINFORCING_GUIDANCE_STATE_CODE:
+        elif message_code == _REINFORCING_GUIDANCE_STATE_CODE:
             reinforcing_guidance_states.append(np.uint8(payload[1]))
             reinforcing_guidance_timestamps.append(timestamp)
 
         # If the starting code is _AVERSIVE_GUIDANCE_STATE_CODE, the message communicates the current aversive
         # (gas puff) trial guidance state.
-        elif payload[0] == _AVERSIVE_GUIDANCE_STATE_CODE:
+        elif message_code == _AVERSIVE_GUIDANCE_STATE_CODE:
             aversive_guidance_states.append(np.uint8(payload[1]))
             aversive_guidance_timestamps.append(timestamp)
 
         # If the starting code is _DISTANCE_SNAPSHOT_CODE, the message communicates a distance snapshot taken when the
         # VR wall cue sequence changes.
-        elif payload[0] == _DISTANCE_SNAPSHOT_CODE:
+        elif message_code == _DISTANCE_SNAPSHOT_CODE:
             # Skips the first byte (message code) and gets the next 8 bytes storing the distance as a float64
             distance_bytes = payload[1:9]
             traveled_distance = distance_bytes.view(dtype="<f8")[0]  # Converts back to float64
@@ -571,14 +666,22 @@ def _extract_mesoscope_vr_data(
 
         # Otherwise, the payload cannot be attributed to a known type and is, therefore, ignored
 
-    # Closes the archive to free up memory
-    archive.close()
+    # Converts the elapsed time values for each data stream into absolute UTC timestamps, in microseconds since epoch
+    # onset.
+    system_times = _convert_to_utc_timestamps(elapsed_timestamps=system_timestamps, onset_us=onset_us)
+    runtime_times = _convert_to_utc_timestamps(elapsed_timestamps=runtime_timestamps, onset_us=onset_us)
+    reinforcing_guidance_times = _convert_to_utc_timestamps(
+        elapsed_timestamps=reinforcing_guidance_timestamps, onset_us=onset_us
+    )
+    aversive_guidance_times = _convert_to_utc_timestamps(
+        elapsed_timestamps=aversive_guidance_timestamps, onset_us=onset_us
+    )
 
     # Converts extracted data into Polar Feather files:
     # System states
     system_dataframe = pl.DataFrame(
         {
-            "time_us": system_timestamps,
+            "time_us": system_times,
             "system_state": system_states,
         }
     )
@@ -587,7 +690,7 @@ def _extract_mesoscope_vr_data(
     # Runtime states
     runtime_dataframe = pl.DataFrame(
         {
-            "time_us": runtime_timestamps,
+            "time_us": runtime_times,
             "runtime_state": runtime_states,
         }
     )
@@ -601,7 +704,7 @@ def _extract_mesoscope_vr_data(
         if reinforcing_guidance_states:
             reinforcing_guidance_dataframe = pl.DataFrame(
                 {
-                    "time_us": reinforcing_guidance_timestamps,
+                    "time_us": reinforcing_guidance_times,
                     "reinforcing_guidance_state": reinforcing_guidance_states,
                 }
             )
@@ -613,7 +716,7 @@ def _extract_mesoscope_vr_data(
         if aversive_guidance_states:
             aversive_guidance_dataframe = pl.DataFrame(
                 {
-                    "time_us": aversive_guidance_timestamps,
+                    "time_us": aversive_guidance_times,
                     "aversive_guidance_state": aversive_guidance_states,
                 }
             )
@@ -1,4 +1,5 @@
 from pathlib import Path
+from collections.abc import Iterator
 
 import numpy as np
 from numpy.typing import NDArray as NDArray
@@ -14,6 +15,9 @@ _RUNTIME_STATE_CODE: int
 _REINFORCING_GUIDANCE_STATE_CODE: int
 _AVERSIVE_GUIDANCE_STATE_CODE: int
 _DISTANCE_SNAPSHOT_CODE: int
+_ZIP_LOCAL_HEADER_SIGNATURE: bytes
+_ZIP_LOCAL_HEADER_SIZE: int
+_NPY_MAGIC: bytes
 
 def _prepare_motif_data(
     trial_motifs: list[NDArray[np.uint8]], trial_distances: list[float]
@@ -39,6 +43,10 @@ def _process_trial_sequence(
     trial_types: NDArray[np.int32],
     trial_distances: NDArray[np.float64],
 ) -> tuple[NDArray[np.uint8], NDArray[np.float64], NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]: ...
+def _iterate_log_messages(log_path: Path) -> Iterator[NDArray[np.uint8]]: ...
+def _convert_to_utc_timestamps(
+    elapsed_timestamps: list[int], onset_us: np.uint64
+) -> NDArray[np.uint64] | list[int]: ...
 def _extract_mesoscope_vr_data(
     log_path: Path, output_directory: Path, experiment_configuration: MesoscopeExperimentConfiguration | None = None
 ) -> None: ...
@@ -0,0 +1,123 @@
+"""Contains tests for classes and methods provided by the runtime.py module."""
+
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from sl_behavior.runtime import _iterate_log_messages, _extract_mesoscope_vr_data
+
+
+def _build_message(source_id: int, timestamp: int, payload: bytes) -> np.ndarray:
+    """Serializes a log message using the source ID, elapsed timestamp, and payload layout used by the data logger."""
+    return np.frombuffer(
+        np.uint8(source_id).tobytes() + np.uint64(timestamp).tobytes() + payload, dtype=np.uint8
+    ).copy()
+
+
+def _write_log(log_path: Path, messages: list[np.ndarray], *, compressed: bool) -> None:
+    """Writes the messages to the target .npz archive in the order they are provided."""
+    arrays = {f"{number:05d}": message for number, message in enumerate(messages)}
+    if compressed:
+        np.savez_compressed(log_path, **arrays)  # type: ignore[arg-type]
+    else:
+        np.savez(log_path, **arrays)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_iterate_log_messages(tmp_path: Path, compressed: bool) -> None:
+    """Verifies that _iterate_log_messages() yields all archived uint8 messages in the order they were logged."""
+    messages = [_build_message(source_id=1, timestamp=number, payload=bytes([1, number])) for number in range(10)]
+    log_path = tmp_path.joinpath("log.npz")
+    _write_log(log_path=log_path, messages=messages, compressed=compressed)
+
+    decoded = list(_iterate_log_messages(log_path=log_path))
+
+    assert len(decoded) == len(messages)
+    for original, message in zip(messages, decoded, strict=True):
+        assert message.dtype == np.uint8
+        np.testing.assert_array_equal(message, original)
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_iterate_log_messages_fallback(tmp_path: Path, compressed: bool) -> None:
+    """Verifies that _iterate_log_messages() reads non-uint8 members using numpy's .npy parser."""
+    message = _build_message(source_id=1, timestamp=5, payload=bytes([1, 2]))
+    matrix = np.arange(6, dtype=np.float64).reshape(2, 3)
+    log_path = tmp_path.joinpath("log.npz")
+    if compressed:
+        np.savez_compressed(log_path, first=message, second=matrix)
+    else:
+        np.savez(log_path, first=message, second=matrix)
+
+    decoded = list(_iterate_log_messages(log_path=log_path))
+
+    assert len(decoded) == 2  # noqa: PLR2004
+    np.testing.assert_array_equal(decoded[0], message)
+    assert decoded[1].dtype == np.float64
+    np.testing.assert_array_equal(decoded[1], matrix)
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_extract_mesoscope_vr_data_with_onset(tmp_path: Path, compressed: bool) -> None:
+    """Verifies that _extract_mesoscope_vr_data() converts elapsed timestamps into absolute UTC timestamps."""
+    onset_us = 1_700_000_000_000_000
+    messages = [
+        _build_message(source_id=1, timestamp=0, payload=np.int64(onset_us).tobytes()),
+        _build_message(source_id=1, timestamp=10, payload=bytes([1, 3])),
+        _build_message(source_id=1, timestamp=20, payload=bytes([2, 4])),
+        _build_message(source_id=1, timestamp=30, payload=bytes([1, 5])),
+    ]
+    log_path = tmp_path.joinpath("log.npz")
+    _write_log(log_path=log_path, messages=messages, compressed=compressed)
+
+    _extract_mesoscope_vr_data(log_path=log_path, output_directory=tmp_path)
+
+    system_dataframe = pl.read_ipc(tmp_path.joinpath("system_state_data.feather"))
+    assert system_dataframe["time_us"].dtype == pl.UInt64
+    assert system_dataframe["time_us"].to_list() == [onset_us + 10, onset_us + 30]
+    assert system_dataframe["system_state"].to_list() == [3, 5]
+
+    runtime_dataframe = pl.read_ipc(tmp_path.joinpath("runtime_state_data.feather"))
+    assert runtime_dataframe["time_us"].to_list() == [onset_us + 20]
+    assert runtime_dataframe["runtime_state"].to_list() == [4]
+
+
+def test_extract_mesoscope_vr_data_without_onset(tmp_path: Path) -> None:
+    """Verifies that _extract_mesoscope_vr_data() processes logs without an onset message."""
+    messages = [
+        _build_message(source_id=1, timestamp=10, payload=bytes([1, 3])),
+        _build_message(source_id=1, timestamp=20, payload=bytes([1, 4])),
+        _build_message(source_id=1, timestamp=30, payload=bytes([2, 5])),
+    ]
+    log_path = tmp_path.joinpath("log.npz")
+    _write_log(log_path=log_path, messages=messages, compressed=False)
+
+    _extract_mesoscope_vr_data(log_path=log_path, output_directory=tmp_path)
+
+    # Without an onset message, the first logged message is skipped and the remaining timestamps are not offset.
+    system_dataframe = pl.read_ipc(tmp_path.joinpath("system_state_data.feather"))
+    assert system_dataframe["time_us"].to_list() == [20]
+    assert system_dataframe["system_state"].to_list() == [4]
+
+    runtime_dataframe = pl.read_ipc(tmp_path.joinpath("runtime_state_data.feather"))
+    assert runtime_dataframe["time_us"].to_list() == [30]
+    assert runtime_dataframe["runtime_state"].to_list() == [5]
+
+
+def test_extract_mesoscope_vr_data_onset_only(tmp_path: Path) -> None:
+    """Verifies that _extract_mesoscope_vr_data() exports empty data streams using the schema of empty lists."""
+    messages = [_build_message(source_id=1, timestamp=0, payload=np.int64(1_700_000_000_000_000).tobytes())]
+    log_path = tmp_path.joinpath("log.npz")
+    _write_log(log_path=log_path, messages=messages, compressed=False)
+
+    _extract_mesoscope_vr_data(log_path=log_path, output_directory=tmp_path)
+
+    system_dataframe = pl.read_ipc(tmp_path.joinpath("system_state_data.feather"))
+    assert system_dataframe.schema == pl.DataFrame({"time_us": [], "system_state": []}).schema
+    assert system_dataframe.height == 0
+
+    runtime_dataframe = pl.read_ipc(tmp_path.joinpath("runtime_state_data.feather"))
+    assert runtime_dataframe.schema == pl.DataFrame({"time_us": [], "runtime_state": []}).schema
+    assert runtime_dataframe.height == 0